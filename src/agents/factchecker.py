@@ -9,6 +9,7 @@ Responsibilities:
 """
 
 import json
+import re
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
@@ -17,6 +18,11 @@ from src.clients.perplexity_client import PerplexityClient
 from src.utils.schemas import get_schema
 
 
+# Fallback score patterns, compiled once since they run on every unparseable verification
+_CREDIBILITY_RE = re.compile(r'credibility\D*?(-?\d+)', re.IGNORECASE)
+_CORRESPONDENCE_RE = re.compile(r'correspondence\D*?(-?\d+)', re.IGNORECASE)
+
+
 class FactCheckerAgent(Agent):
     """Agent that verifies citations and responds to criticism."""
     
@@ -388,10 +394,8 @@ Be concise, professional, and effective. Do not be defensive or dismissive."""
             Verification dictionary
         """
         # Try to extract scores using regex
-        import re
-        
-        credibility_match = re.search(r'credibility.*?(\d+)', response, re.IGNORECASE)
-        correspondence_match = re.search(r'correspondence.*?(\d+)', response, re.IGNORECASE)
+        credibility_match = _CREDIBILITY_RE.search(response)
+        correspondence_match = _CORRESPONDENCE_RE.search(response)
         
         credibility_score = int(credibility_match.group(1)) if credibility_match else 5
         correspondence_score = int(correspondence_match.group(1)) if correspondence_match else 5
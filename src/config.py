@@ -55,6 +55,9 @@ class Config:
     # Logging
     log_level: str = "INFO"
     
+    # Storage (each debate lives in debates_root/<debate_id>)
+    debates_root: Path = Path("debates")
+    
     # Cost Controls
     cost_budget: Optional[CostBudget] = None
     cost_budget_preset: str = "balanced"  # "conservative", "balanced", or "premium"
@@ -13,12 +13,15 @@ Date: January 2026
 """
 
 import asyncio
-import json
+import csv
+import os
 import uuid
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 from src.agents.base import Agent, AgentContext, AgentResponse, FileUpdate, FileUpdateOperation
 from src.agents.crowd import CrowdAgent
@@ -26,12 +29,83 @@ from src.agents.debator import DebatorAgent
 from src.agents.factchecker import FactCheckerAgent
 from src.agents.judge import JudgeAgent
 from src.config import Config
+from src.utils import fast_json
 from src.utils.file_manager import FileManager
 from src.utils.state_manager import DebatePhase, DebateState
 from src.utils.debate_logger import DebateLogger
 from src.utils.raw_data_logger import RawDataLogger
 
 
+@dataclass(frozen=True, slots=True)
+class AgentSpec:
+    """How to construct one of the debate's agents."""
+    name: str
+    cls: Type[Agent]
+    team: Optional[str] = None  # "a"/"b" for team agents
+    takes_stance: bool = False  # Debators argue their team's stance
+
+
+# The fixed six-agent lineup, in construction order
+AGENT_SPECS = (
+    AgentSpec("debator_a", DebatorAgent, team="a", takes_stance=True),
+    AgentSpec("debator_b", DebatorAgent, team="b", takes_stance=True),
+    AgentSpec("factchecker_a", FactCheckerAgent, team="a"),
+    AgentSpec("factchecker_b", FactCheckerAgent, team="b"),
+    AgentSpec("judge", JudgeAgent),
+    AgentSpec("crowd", CrowdAgent),
+)
+
+# Agents whose completed turn triggers a checkpoint: debators (expensive
+# Deep Research), judge (phase end) and crowd (Vote 0 and round boundaries)
+_CHECKPOINT_AGENTS = frozenset({"debator_a", "debator_b", "judge", "crowd"})
+
+# Completed turns are appended here; the checkpoint only records how many
+TURN_LOG_FILE = "completed_turns.ndjson"
+
+# fdatasync skips the metadata flush but is missing on Windows and macOS
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _read_turn_log(path: Path, count: int) -> List[Dict[str, Any]]:
+    """
+    Replay the first count turns from the turn log.
+    
+    Lines past count were appended after the last checkpoint was written
+    (e.g. a crash between the two writes) and are truncated away.
+    """
+    turns: List[Dict[str, Any]] = []
+    if count == 0:
+        return turns
+    
+    with open(path, "rb+") as f:
+        for line in f:
+            turns.append(fast_json.loads(line))
+            if len(turns) == count:
+                break
+        f.truncate(f.tell())
+    
+    return turns
+
+
+def _persona_type(voter: Dict[str, Any]) -> str:
+    """Voter persona type from either the flat or the nested persona format."""
+    if "persona_type" in voter:
+        return voter["persona_type"]
+    persona = voter.get("persona")
+    if isinstance(persona, dict):
+        return persona.get("type", "unknown")
+    return "unknown"
+
+
+def _iter_sentiment_rows(voters: List[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Yield (round, voter_id, score, persona_type) for every recorded vote."""
+    for voter in voters:
+        voter_id = voter["voter_id"]
+        persona_type = _persona_type(voter)
+        for vote_record in voter["voting_history"]:
+            yield vote_record["round"], voter_id, vote_record["score"], persona_type
+
+
 class DebateModerator:
     """
     Orchestrates the complete debate workflow.
@@ -59,7 +133,7 @@ class DebateModerator:
         self.config = config
         
         # Setup directories and managers
-        self.debate_dir = Path(f"debates/{self.debate_id}")
+        self.debate_dir = config.debates_root / self.debate_id
         self.file_manager = FileManager(str(self.debate_dir))
         
         # Initialize loggers
@@ -73,6 +147,19 @@ class DebateModerator:
         self.completed_turns: List[Dict[str, Any]] = []
         self.total_cost: float = 0.0
         
+        # Turn log stays open between saves (see _save_checkpoint)
+        self._turn_log_fd: Optional[int] = None
+        self._logged_turns = 0
+        
+        # Background checkpoint writer; only the newest pending payload is kept
+        self._pending_checkpoint: Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]] = None
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        self._last_checkpoint_key: Optional[Tuple[Dict[str, Any], int, float]] = None
+        
+        # Running per-agent cost totals, folded in from completed_turns lazily
+        self._cost_by_agent: Counter = Counter()
+        self._costed_turns = 0
+        
         # Agents (initialized after Vote 0 determines stances)
         self.agents: Dict[str, Agent] = {}
     
@@ -138,16 +225,33 @@ class DebateModerator:
             print(f"{'='*60}")
             print(f"Total Turns: {self.state.turn_count}")
             print(f"Total Cost: ${self.total_cost:.2f}")
-            print(f"Outputs: debates/{self.debate_id}/outputs/")
+            print(f"Outputs: {self.debate_dir / 'outputs'}/")
             print(f"{'='*60}\n")
             
             return self.debate_id
             
         except Exception as e:
             print(f"\n❌ Debate failed: {e}")
-            print(f"💾 Checkpoint saved at: debates/{self.debate_id}/moderator_checkpoint.json")
+            print(f"💾 Checkpoint saved at: {self.debate_dir / 'moderator_checkpoint.json'}")
             print(f"Resume with: DebateModerator.resume_from_checkpoint('{self.debate_id}')")
             raise
+        
+        finally:
+            await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Flush pending checkpoints and release open file handles."""
+        try:
+            await self._flush_checkpoint()
+        finally:
+            self._close_files()
+    
+    def _close_files(self) -> None:
+        """Close cached file handles (each is reopened on next use)."""
+        self.file_manager.close_all()
+        if self._turn_log_fd is not None:
+            os.close(self._turn_log_fd)
+            self._turn_log_fd = None
     
     @classmethod
     async def resume_from_checkpoint(cls, debate_id: str, config: Config) -> "DebateModerator":
@@ -166,7 +270,8 @@ class DebateModerator:
         Raises:
             FileNotFoundError: If checkpoint doesn't exist
         """
-        checkpoint_path = Path(f"debates/{debate_id}/moderator_checkpoint.json")
+        debate_dir = config.debates_root / debate_id
+        checkpoint_path = debate_dir / "moderator_checkpoint.json"
         
         if not checkpoint_path.exists():
             raise FileNotFoundError(
@@ -178,8 +283,7 @@ class DebateModerator:
         print(f"♻️  RESUMING FROM CHECKPOINT")
         print(f"{'='*60}")
         
-        with open(checkpoint_path) as f:
-            checkpoint = json.load(f)
+        checkpoint = fast_json.load_file(checkpoint_path)
         
         # Reconstruct moderator state
         moderator = cls.__new__(cls)
@@ -189,23 +293,39 @@ class DebateModerator:
         
         # Reconstruct state
         moderator.state = DebateState.from_checkpoint(checkpoint["state"])
-        moderator.completed_turns = checkpoint["completed_turns"]
         moderator.total_cost = checkpoint["costs"]["total"]
+        moderator.debate_dir = debate_dir
+        
+        # Version 1.0 checkpoints embed the turns instead of using the turn log
+        if "completed_turns" in checkpoint:
+            moderator.completed_turns = checkpoint["completed_turns"]
+            moderator._logged_turns = 0
+        else:
+            moderator.completed_turns = _read_turn_log(
+                moderator.debate_dir / TURN_LOG_FILE, checkpoint["turn_log_count"]
+            )
+            moderator._logged_turns = len(moderator.completed_turns)
+        
+        moderator._turn_log_fd = None
+        moderator._pending_checkpoint = None
+        moderator._checkpoint_task = None
+        moderator._last_checkpoint_key = None
+        moderator._cost_by_agent = Counter()
+        moderator._costed_turns = 0
         
         # Reinitialize managers and agents
-        moderator.debate_dir = Path(f"debates/{debate_id}")
         moderator.file_manager = FileManager(str(moderator.debate_dir))
         
         # Initialize loggers
         moderator.logger = DebateLogger(moderator.debate_id, moderator.debate_dir)
         moderator.raw_data_logger = RawDataLogger(moderator.debate_id, str(moderator.debate_dir))
         
-        moderator.agents = moderator._initialize_agents(
+        moderator.agents = await moderator._initialize_agents(
             team_a_stance=checkpoint["state"]["team_assignments"]["team_a"]["stance"],
             team_b_stance=checkpoint["state"]["team_assignments"]["team_b"]["stance"]
         )
         
-        last_turn = checkpoint["completed_turns"][-1] if checkpoint["completed_turns"] else None
+        last_turn = moderator.completed_turns[-1] if moderator.completed_turns else None
         print(f"Topic: {moderator.topic}")
         print(f"Last turn: {last_turn['agent'] if last_turn else 'None'}")
         print(f"Turn count: {moderator.state.turn_count}")
@@ -264,8 +384,7 @@ class DebateModerator:
             raise Exception(f"Vote 0 failed: {vote_zero_response.errors}")
         
         # Apply file updates from Vote 0
-        for update in vote_zero_response.file_updates:
-            self._apply_file_update(update)
+        self._apply_file_updates(vote_zero_response.file_updates)
         
         # 3. Process Vote 0 results
         votes = vote_zero_response.output["votes"]
@@ -313,11 +432,12 @@ class DebateModerator:
         # 6. Initialize all agents with correct stances
         team_a_stance = self.state.team_assignments['team_a']['stance']
         team_b_stance = self.state.team_assignments['team_b']['stance']
-        self.agents = self._initialize_agents(team_a_stance, team_b_stance)
+        self.agents = await self._initialize_agents(team_a_stance, team_b_stance)
         print("✅ All agents initialized")
         
         # Save checkpoint before expensive Deep Research
         self._save_checkpoint()
+        await self._flush_checkpoint()
         
         # 7. Transition to opening
         self.state.transition_to(DebatePhase.OPENING)
@@ -540,6 +660,7 @@ class DebateModerator:
             state_snapshot=self.state.to_dict()
         )
         self._save_checkpoint()
+        await self._flush_checkpoint()
         
         print(f"\n✅ Phase 3 complete\n")
     
@@ -632,9 +753,8 @@ class DebateModerator:
             errors=response.errors if not response.success else None
         )
         
-        # Apply file updates
-        for update in response.file_updates:
-            self._apply_file_update(update)
+        # Apply file updates (one read/write per touched file)
+        self._apply_file_updates(response.file_updates)
         
         # Record completion
         duration = (datetime.utcnow() - start_time).total_seconds()
@@ -666,48 +786,70 @@ class DebateModerator:
     
     def _apply_file_update(self, update: FileUpdate) -> None:
         """
-        Apply file update from agent.
-        
-        Maps FileUpdateOperation to FileManager methods.
+        Apply a single file update from agent.
         
         Args:
             update: FileUpdate object from agent
         """
-        # Log file update
-        self.logger.log_file_update(
-            file_type=update.file_type,
-            operation=update.operation.name,
-            data=update.data
-        )
+        self._apply_file_updates([update])
+    
+    def _apply_file_updates(self, updates: List[FileUpdate]) -> None:
+        """
+        Apply a turn's file updates from agent.
+        
+        Each touched file is read and written once for the whole batch.
+        
+        Args:
+            updates: FileUpdate objects from agent, in the order produced
+        """
+        if not updates:
+            return
+        
+        # Log file updates
+        for update in updates:
+            self.logger.log_file_update(
+                file_type=update.file_type,
+                operation=update.operation.name,
+                data=update.data
+            )
+        
+        self.file_manager.apply_updates(updates, self._apply_update_in_place)
+    
+    def _apply_update_in_place(self, data: Dict[str, Any], update: FileUpdate) -> None:
+        """
+        Apply one file update to its loaded target file.
         
+        Maps FileUpdateOperation to FileManager edits.
+        
+        Args:
+            data: Loaded contents of update.file_type
+            update: FileUpdate object from agent
+        """
         if update.operation == FileUpdateOperation.APPEND_TURN:
             # Add turn to history_chat
             speaker = update.data.get("speaker")
-            self.file_manager.append_turn(speaker, update.data)
+            FileManager._append_turn_to(data, speaker, update.data)
         
         elif update.operation == FileUpdateOperation.ADD_CITATION:
             # Add citation to citation_pool
             team = update.data["team"]
             key = update.data["key"]
             citation = update.data["citation"]
-            self.file_manager.add_citation(team, key, citation)
+            FileManager._add_citation_to(data, team, key, citation)
         
         elif update.operation == FileUpdateOperation.UPDATE_VERIFICATION:
             # Update verification in citation_pool
             team = update.data["team"]
             key = update.data["key"]
             verification = update.data["verification"]
-            self.file_manager.update_verification(team, key, verification)
+            FileManager._update_verification_in(data, team, key, verification)
         
         elif update.operation == FileUpdateOperation.UPDATE_DEBATE_LATENT:
             # Append to debate_latent round_history
-            data = self.file_manager._read_json("debate_latent")
             data["round_history"].append(update.data)
-            self.file_manager.write_by_moderator("debate_latent", data)
         
         elif update.operation == FileUpdateOperation.ADD_CROWD_VOTE:
             # Add vote round to crowd_opinion
-            data = self.file_manager._read_json("crowd_opinion")
             vote_round = update.data
             
             # Initialize vote_rounds if it doesn't exist
@@ -718,15 +860,15 @@ class DebateModerator:
             if "voters" not in data:
                 data["voters"] = []
             
+            # Index voters once so each vote is a dict lookup, not a list scan
+            voters_by_id = {v["voter_id"]: v for v in data["voters"]}
+            
             # Update voter records
             for vote in vote_round["votes"]:
                 voter_id = vote["voter_id"]
                 
                 # Find or create voter
-                voter = next(
-                    (v for v in data["voters"] if v["voter_id"] == voter_id),
-                    None
-                )
+                voter = voters_by_id.get(voter_id)
                 
                 if voter:
                     # Update existing voter
@@ -751,6 +893,7 @@ class DebateModerator:
                         "current_score": vote["score"]
                     }
                     data["voters"].append(new_voter)
+                    voters_by_id[voter_id] = new_voter
             
             # Add round summary
             data["vote_rounds"].append({
@@ -759,10 +902,8 @@ class DebateModerator:
                 "vote_count": vote_round["vote_count"],
                 "timestamp": vote_round["timestamp"]
             })
-            
-            self.file_manager.write_by_moderator("crowd_opinion", data)
     
-    def _initialize_agents(
+    async def _initialize_agents(
         self,
         team_a_stance: str,
         team_b_stance: str
@@ -770,6 +911,9 @@ class DebateModerator:
         """
         Create all agent instances.
         
+        Constructors set up API clients (and the crowd loads its personas)
+        independently, so they run concurrently on worker threads.
+        
         Args:
             team_a_stance: Stance for team a ("for" or "against")
             team_b_stance: Stance for team b ("for" or "against")
@@ -777,52 +921,23 @@ class DebateModerator:
         Returns:
             Dictionary of {agent_name: agent_instance}
         """
-        agents = {
-            "debator_a": DebatorAgent(
-                name="debator_a",
-                team="a",
-                stance=team_a_stance,
-                file_manager=self.file_manager,
-                config=self.config,
-                raw_data_logger=self.raw_data_logger
-            ),
-            "debator_b": DebatorAgent(
-                name="debator_b",
-                team="b",
-                stance=team_b_stance,
-                file_manager=self.file_manager,
-                config=self.config,
-                raw_data_logger=self.raw_data_logger
-            ),
-            "factchecker_a": FactCheckerAgent(
-                name="factchecker_a",
-                team="a",
-                file_manager=self.file_manager,
-                config=self.config,
-                raw_data_logger=self.raw_data_logger
-            ),
-            "factchecker_b": FactCheckerAgent(
-                name="factchecker_b",
-                team="b",
-                file_manager=self.file_manager,
-                config=self.config,
-                raw_data_logger=self.raw_data_logger
-            ),
-            "judge": JudgeAgent(
-                name="judge",
-                file_manager=self.file_manager,
-                config=self.config,
-                raw_data_logger=self.raw_data_logger
-            ),
-            "crowd": CrowdAgent(
-                name="crowd",
-                file_manager=self.file_manager,
-                config=self.config,
-                raw_data_logger=self.raw_data_logger
-            )
+        stances = {"a": team_a_stance, "b": team_b_stance}
+        shared = {
+            "file_manager": self.file_manager,
+            "config": self.config,
+            "raw_data_logger": self.raw_data_logger
         }
         
-        return agents
+        def build(spec: AgentSpec) -> Agent:
+            kwargs = dict(shared)
+            if spec.team is not None:
+                kwargs["team"] = spec.team
+            if spec.takes_stance:
+                kwargs["stance"] = stances[spec.team]
+            return spec.cls(name=spec.name, **kwargs)
+        
+        agents = await asyncio.gather(*(asyncio.to_thread(build, spec) for spec in AGENT_SPECS))
+        return {spec.name: agent for spec, agent in zip(AGENT_SPECS, agents)}
     
     # ========================================================================
     # CHECKPOINT MANAGEMENT
@@ -837,30 +952,44 @@ class DebateModerator:
         - Each debator turn (Deep Research = $0.08)
         - Each phase transition
         - Each round completes (after judge/crowd)
+        
+        Turns completed since the last save are appended to the turn log, so
+        each save writes O(new turns) rather than the whole history.
+        
+        Inside an event loop the write happens on a worker thread so the
+        debate doesn't wait on fdatasync; saves that arrive while a write is
+        in flight are coalesced into the newest one. Use _flush_checkpoint
+        to wait for it.
+        
+        A save identical to the previous one apart from its timestamp is
+        skipped, since the file already holds that state.
         """
-        checkpoint = {
-            "debate_id": self.debate_id,
-            "topic": self.topic,
-            "checkpoint_version": "1.0",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "state": {
-                "phase": self.state.phase.value,
-                "round_number": self.state.round_number,
-                "turn_count": self.state.turn_count,
-                "current_speaker": self.state.current_speaker,
-                "team_assignments": self.state.team_assignments,
-                "resource_multiplier": self.state.resource_multiplier
-            },
-            "completed_turns": self.completed_turns,
-            "costs": {
-                "total": self.total_cost,
-                "by_agent": self._calculate_cost_by_agent()
-            }
-        }
+        # Everything else in the payload derives from these, so an unchanged
+        # save returns before the payload is built
+        state = self.state.to_dict()
+        key = (state, len(self.completed_turns), self.total_cost)
+        if key == self._last_checkpoint_key:
+            return
         
-        checkpoint_path = self.debate_dir / "moderator_checkpoint.json"
-        with open(checkpoint_path, 'w') as f:
-            json.dump(checkpoint, f, indent=2)
+        checkpoint = self._snapshot(state)
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_checkpoint(checkpoint, self.completed_turns)
+        else:
+            self._pending_checkpoint = (checkpoint, self.completed_turns)
+            task = self._checkpoint_task
+            if task is None or task.done():
+                if task is not None:
+                    # Surface a failed background write once; the next save
+                    # starts a fresh writer for the pending payload
+                    self._checkpoint_task = None
+                    task.result()
+                self._checkpoint_task = loop.create_task(self._drain_checkpoints())
+        
+        # Only counted as saved once written or queued behind the writer
+        self._last_checkpoint_key = key
         
         # Log checkpoint save
         self.logger.log_moderator_action(
@@ -873,6 +1002,96 @@ class DebateModerator:
             }
         )
     
+    def _snapshot(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the checkpoint payload from the current in-memory state.
+        
+        The payload may be serialized later on the writer thread, so it must
+        not share anything the debate mutates, and a new one is built per
+        save rather than updating the previous (possibly in-flight) payload.
+        No deep copy is needed: to_dict() and the cost rollup return fresh
+        dicts, team_assignments is only ever replaced, and completed_turns is
+        referenced by count since the list is append-only and its turn dicts
+        are never modified.
+        
+        Args:
+            state: self.state.to_dict(), already taken by the caller
+        """
+        return {
+            "debate_id": self.debate_id,
+            "topic": self.topic,
+            "checkpoint_version": "1.1",
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "state": state,
+            "turn_log_count": len(self.completed_turns),
+            "costs": {
+                "total": self.total_cost,
+                "by_agent": self._calculate_cost_by_agent()
+            }
+        }
+    
+    async def _drain_checkpoints(self) -> None:
+        """Write pending checkpoints on a worker thread until none are left."""
+        while self._pending_checkpoint is not None:
+            (checkpoint, turns), self._pending_checkpoint = self._pending_checkpoint, None
+            try:
+                await asyncio.to_thread(self._write_checkpoint, checkpoint, turns)
+            except BaseException:
+                # The state wasn't saved, so the next save mustn't be skipped
+                self._last_checkpoint_key = None
+                raise
+    
+    async def _flush_checkpoint(self) -> None:
+        """Wait for any background checkpoint write to reach disk."""
+        # A save made during the wait either joins the running writer or,
+        # once it has finished, starts a new one; wait for that one too
+        while self._checkpoint_task is not None:
+            task = self._checkpoint_task
+            try:
+                await task
+            finally:
+                if self._checkpoint_task is task:
+                    self._checkpoint_task = None
+    
+    def _write_checkpoint(self, checkpoint: Dict[str, Any], turns: List[Dict[str, Any]]) -> None:
+        """
+        Persist a checkpoint payload: turn log first, then the checkpoint.
+        
+        turns is the completed_turns list the payload was taken from, so a
+        list reassigned in the meantime can't leak into this write.
+        """
+        self._append_turn_log(turns, checkpoint["turn_log_count"])
+        
+        # Write a synced temp file and rename it over the checkpoint, so a
+        # crash mid-write leaves the previous checkpoint intact
+        checkpoint_path = self.debate_dir / "moderator_checkpoint.json"
+        temp_path = checkpoint_path.with_suffix('.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(fast_json.dumps(checkpoint, indent=True))
+            f.flush()
+            _fdatasync(f.fileno())
+        os.replace(temp_path, checkpoint_path)
+    
+    def _append_turn_log(self, turns: List[Dict[str, Any]], upto: int) -> None:
+        """Append turns[:upto] not yet in the turn log, one JSON object per line."""
+        pending = turns[self._logged_turns:upto]
+        if not pending:
+            return
+        
+        if self._turn_log_fd is None:
+            flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+            if self._logged_turns == 0:
+                flags |= os.O_TRUNC  # Nothing logged yet, drop any stale log
+            self._turn_log_fd = os.open(self.debate_dir / TURN_LOG_FILE, flags, 0o644)
+        
+        os.write(
+            self._turn_log_fd,
+            b"".join(fast_json.dumps(turn) + b"\n" for turn in pending)
+        )
+        # The checkpoint written next must never count turns that aren't on disk
+        _fdatasync(self._turn_log_fd)
+        self._logged_turns += len(pending)
+    
     def _should_checkpoint(self, agent_name: str, context_params: Dict[str, Any]) -> bool:
         """
         Determine if we should save a checkpoint.
@@ -890,39 +1109,25 @@ class DebateModerator:
         Returns:
             True if checkpoint should be saved
         """
-        # Vote 0 just completed
-        if context_params.get("round_number") == 0 and agent_name == "crowd":
-            return True
-        
-        # Debator turn (expensive Deep Research)
-        if "debator" in agent_name:
-            return True
-        
-        # Round completes (after crowd votes)
-        if agent_name == "crowd":
-            return True
-        
-        # Phase transition (judge typically marks phase end)
-        if agent_name == "judge":
-            return True
-        
-        return False
+        return agent_name in _CHECKPOINT_AGENTS
     
     def _calculate_cost_by_agent(self) -> Dict[str, float]:
         """
         Calculate total cost per agent.
         
+        completed_turns is append-only, so only turns added since the last
+        call are summed; every checkpoint calls this.
+        
         Returns:
             Dictionary of {agent_name: total_cost}
         """
-        cost_by_agent: Dict[str, float] = {}
+        cost_by_agent = self._cost_by_agent
         
-        for turn in self.completed_turns:
-            agent = turn["agent"]
-            cost = turn.get("cost", 0.0)
-            cost_by_agent[agent] = cost_by_agent.get(agent, 0.0) + cost
+        for turn in self.completed_turns[self._costed_turns:]:
+            cost_by_agent[turn["agent"]] += turn.get("cost", 0.0)
+        self._costed_turns = len(self.completed_turns)
         
-        return cost_by_agent
+        return dict(cost_by_agent)
     
     # ========================================================================
     # OUTPUT GENERATION
@@ -967,16 +1172,22 @@ class DebateModerator:
     
     async def _generate_transcript(self, output_dir: Path, history: Dict[str, Any]) -> None:
         """Generate human-readable transcript in Markdown."""
-        lines = [
-            f"# Debate Transcript",
-            f"",
-            f"**Topic**: {self.topic}",
-            f"**Debate ID**: {self.debate_id}",
-            f"**Date**: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC",
-            f"",
-            f"---",
-            f""
-        ]
+        # Stream sections through one large buffer instead of joining them first
+        transcript_path = output_dir / "transcript_full.md"
+        with open(transcript_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(self._iter_transcript_sections(history))
+    
+    def _iter_transcript_sections(self, history: Dict[str, Any]) -> Iterator[str]:
+        """Yield transcript Markdown; sections after the header lead with their newline."""
+        yield (
+            f"# Debate Transcript\n"
+            f"\n"
+            f"**Topic**: {self.topic}\n"
+            f"**Debate ID**: {self.debate_id}\n"
+            f"**Date**: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC\n"
+            f"\n"
+            f"---\n"
+        )
         
         # Public transcript contains main statements
         for turn in history.get("public_transcript", []):
@@ -985,61 +1196,44 @@ class DebateModerator:
             phase = turn.get("phase", "unknown")
             statement = turn.get("statement", turn.get("main_statement", ""))
             
-            lines.append(f"## Round {round_num} - {speaker} ({phase})")
-            lines.append(f"")
-            lines.append(statement)
-            lines.append(f"")
-            lines.append(f"---")
-            lines.append(f"")
+            yield f"\n## Round {round_num} - {speaker} ({phase})\n\n{statement}\n\n---\n"
         
         # Add team notes as supplementary sections if needed
         team_notes = history.get("team_notes", {})
         if team_notes.get("a") or team_notes.get("b"):
-            lines.append(f"## Supplementary Materials")
-            lines.append(f"")
+            yield "\n## Supplementary Materials\n"
             
             for team in ["a", "b"]:
                 if team_notes.get(team):
-                    lines.append(f"### Team {team.upper()}")
+                    yield f"\n### Team {team.upper()}"
                     for note in team_notes[team]:
                         supp = note.get("supplementary_material", "")
                         if supp:
-                            lines.append(f"<details>")
-                            lines.append(f"<summary>Round {note.get('round', 0)}</summary>")
-                            lines.append(f"")
-                            lines.append(supp)
-                            lines.append(f"</details>")
-                            lines.append(f"")
-        
-        transcript_path = output_dir / "transcript_full.md"
-        with open(transcript_path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
+                            yield (
+                                f"\n<details>\n"
+                                f"<summary>Round {note.get('round', 0)}</summary>\n"
+                                f"\n"
+                                f"{supp}\n"
+                                f"</details>\n"
+                            )
     
     async def _generate_citation_ledger(self, output_dir: Path, citations: Dict[str, Any]) -> None:
         """Generate citation ledger with verification scores."""
         ledger_path = output_dir / "citation_ledger.json"
-        with open(ledger_path, 'w') as f:
-            json.dump(citations, f, indent=2)
+        with open(ledger_path, 'wb') as f:
+            f.write(fast_json.dumps(citations, indent=True))
     
     async def _generate_logic_map(self, output_dir: Path, latent: Dict[str, Any]) -> None:
         """Generate debate logic map showing frontier evolution."""
         logic_path = output_dir / "debate_logic_map.json"
-        with open(logic_path, 'w') as f:
-            json.dump(latent, f, indent=2)
+        with open(logic_path, 'wb') as f:
+            f.write(fast_json.dumps(latent, indent=True))
     
     async def _generate_sentiment_graph(self, output_dir: Path, crowd: Dict[str, Any]) -> None:
         """Generate CSV of voter sentiment over time."""
-        lines = ["round,voter_id,score,persona_type"]
-        
-        for voter in crowd["voters"]:
-            for vote_record in voter["voting_history"]:
-                lines.append(
-                    f"{vote_record['round']},"
-                    f"{voter['voter_id']},"
-                    f"{vote_record['score']},"
-                    f"{voter['persona_type']}"
-                )
-        
+        # csv.writer formats rows in C and quotes persona types with commas
         csv_path = output_dir / "voter_sentiment_graph.csv"
-        with open(csv_path, 'w') as f:
-            f.write("\n".join(lines))
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(("round", "voter_id", "score", "persona_type"))
+            writer.writerows(_iter_sentiment_rows(crowd["voters"]))
@@ -0,0 +1,62 @@
+"""
+Fast JSON - Byte-oriented JSON encode/decode for checkpoints and outputs.
+
+Uses orjson when it is installed and falls back to the stdlib json module,
+so callers never need to know which backend is active.
+"""
+
+import json
+import mmap
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-compatible object
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Parse JSON from str or any bytes-like buffer.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error
+            type subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if not isinstance(data, (bytes, bytearray, str)):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def load_file(path: Union[str, os.PathLike]) -> Any:
+    """
+    Parse a JSON file by memory-mapping it.
+
+    orjson reads the mapped pages directly, so a large checkpoint is never
+    copied into an intermediate bytes object first.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return loads(view)
@@ -8,14 +8,16 @@ This module provides:
 - Thread-safe file operations
 """
 
-import json
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from threading import Lock
 
+from src.utils import fast_json
+
 
 # Permission Matrix - defines what each agent can read
 PERMISSIONS = {
@@ -67,6 +69,13 @@ PERMISSIONS = {
 class FileManager:
     """Manages all file I/O operations with permission enforcement."""
     
+    # Write the independent init files concurrently (disable for ordered writes)
+    _PARALLEL_INIT = True
+    
+    # Keep read handles open between calls. Windows can't rename over an
+    # open file and has no pread, so it reopens on every read instead.
+    _CACHE_HANDLES = hasattr(os, "pread")
+    
     def __init__(self, debate_dir: str):
         """
         Initialize FileManager for a specific debate.
@@ -88,15 +97,34 @@ class FileManager:
             "debate_latent": self.debate_dir / "debate_latent.json",
             "crowd_opinion": self.debate_dir / "crowd_opinion.json"
         }
+        
+        # Cached read descriptors, keyed by file_type
+        self._fds: Dict[str, int] = {}
+        self._fd_lock = Lock()
+    
+    def __del__(self):
+        """Release cached handles when the manager is discarded."""
+        if getattr(self, "_fds", None):
+            self.close_all()
     
     def initialize_files(self, debate_id: str, topic: str) -> None:
         """
         Initialize all JSON files with empty structures.
         
+        Idempotent: if all four files exist and already belong to this
+        debate_id, they are left untouched so restarted debates keep their
+        existing data. A partial set (e.g. from an interrupted init) is
+        written again.
+        
         Args:
             debate_id: Unique identifier for the debate
             topic: The debate topic
         """
+        if all(path.exists() for path in self.files.values()):
+            existing = self._read_json("history_chat")
+            if existing.get("debate_id") == debate_id:
+                return
+        
         # Initialize history_chat.json
         history_chat = {
             "debate_id": debate_id,
@@ -112,7 +140,6 @@ class FileManager:
                 "b": []
             }
         }
-        self.write_by_moderator("history_chat", history_chat)
         
         # Initialize citation_pool.json
         citation_pool = {
@@ -123,21 +150,33 @@ class FileManager:
             },
             "index_by_round": {}
         }
-        self.write_by_moderator("citation_pool", citation_pool)
         
         # Initialize debate_latent.json
         debate_latent = {
             "debate_id": debate_id,
             "round_history": []
         }
-        self.write_by_moderator("debate_latent", debate_latent)
         
         # Initialize crowd_opinion.json
         crowd_opinion = {
             "debate_id": debate_id,
             "voters": []
         }
-        self.write_by_moderator("crowd_opinion", crowd_opinion)
+        
+        initial_files = [
+            ("history_chat", history_chat),
+            ("citation_pool", citation_pool),
+            ("debate_latent", debate_latent),
+            ("crowd_opinion", crowd_opinion)
+        ]
+        
+        # Each file has its own temp path, so the atomic writes are independent
+        if self._PARALLEL_INIT:
+            with ThreadPoolExecutor(max_workers=len(initial_files)) as executor:
+                list(executor.map(lambda item: self.write_by_moderator(*item), initial_files))
+        else:
+            for file_type, data in initial_files:
+                self.write_by_moderator(file_type, data)
     
     def read_for_agent(self, agent_name: str, file_type: str) -> Dict[str, Any]:
         """
@@ -200,20 +239,34 @@ class FileManager:
             turn_data: Turn data to append
         """
         data = self._read_json("history_chat")
+        self._append_turn_to(data, speaker, turn_data)
+        self._write_json("history_chat", data)
+    
+    def apply_updates(self, updates: List[Any], apply: Callable[[Dict[str, Any], Any], None]) -> None:
+        """
+        Apply a batch of updates with one read and one write per target file.
         
-        # Determine if this goes to public_transcript or team_notes
-        if "statement" in turn_data:
-            # Main statement goes to public transcript
-            data["public_transcript"].append(turn_data)
+        Updates are grouped by file_type (keeping their order within a file),
+        so a turn that touches a file several times pays for one atomic write.
         
-        if "supplementary_material" in turn_data:
-            # Supplementary material goes to team notes
-            team_key = speaker.lower()
-            if team_key not in data["team_notes"]:
-                data["team_notes"][team_key] = []
-            data["team_notes"][team_key].append(turn_data)
+        Args:
+            updates: Update objects with a file_type attribute (e.g. FileUpdate)
+            apply: Callback that edits the loaded file data in place for one update
         
-        self._write_json("history_chat", data)
+        Raises:
+            ValueError: If an update targets an invalid file type
+        """
+        by_file: Dict[str, List[Any]] = {}
+        for update in updates:
+            if update.file_type not in self.files:
+                raise ValueError(f"Invalid file type: {update.file_type}")
+            by_file.setdefault(update.file_type, []).append(update)
+        
+        for file_type, file_updates in by_file.items():
+            data = self._read_json(file_type)
+            for update in file_updates:
+                apply(data, update)
+            self._write_json(file_type, data)
     
     def generate_citation_key(self, team: str) -> str:
         """
@@ -239,31 +292,7 @@ class FileManager:
             citation_data: Citation data
         """
         data = self._read_json("citation_pool")
-        
-        team_key = f"team {team}"
-        if team_key not in data["citations"]:
-            data["citations"][team_key] = {}
-        
-        # Initialize verification if not present
-        if "verification" not in citation_data:
-            citation_data["verification"] = {
-                "source_credibility_score": None,
-                "content_correspondence_score": None,
-                "adversary_comment": None,
-                "proponent_response": None,
-                "verified_by": None,
-                "verified_at": None
-            }
-        
-        data["citations"][team_key][citation_key] = citation_data
-        
-        # Update round index
-        round_num = str(citation_data.get("added_in_round", 0))
-        if round_num not in data["index_by_round"]:
-            data["index_by_round"][round_num] = []
-        if citation_key not in data["index_by_round"][round_num]:
-            data["index_by_round"][round_num].append(citation_key)
-        
+        self._add_citation_to(data, team, citation_key, citation_data)
         self._write_json("citation_pool", data)
     
     def update_verification(self, team: str, citation_key: str, verification: Dict[str, Any]) -> None:
@@ -276,29 +305,53 @@ class FileManager:
             verification: Verification data
         """
         data = self._read_json("citation_pool")
-        
-        team_key = f"team {team}"
-        if team_key in data["citations"] and citation_key in data["citations"][team_key]:
-            data["citations"][team_key][citation_key]["verification"].update(verification)
-            self._write_json("citation_pool", data)
-        else:
-            raise ValueError(f"Citation {citation_key} not found for {team_key}")
+        self._update_verification_in(data, team, citation_key, verification)
+        self._write_json("citation_pool", data)
     
     def file_path(self, file_type: str) -> Path:
         """Get the file path for a given file type."""
         return self.files.get(file_type)
     
+    def close_all(self) -> None:
+        """Close cached read handles (reopened on the next read)."""
+        with self._fd_lock:
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+    
     # Private methods
     
     def _read_json(self, file_type: str) -> Dict[str, Any]:
-        """Read JSON file."""
+        """
+        Read JSON file.
+        
+        Every agent reads every file each turn, so descriptors are cached.
+        Writes replace the file (new inode), which invalidates the cached
+        descriptor; pread keeps concurrent readers off a shared offset.
+        """
         file_path = self.files[file_type]
         
-        if not file_path.exists():
-            return {}
+        if not self._CACHE_HANDLES:
+            if not file_path.exists():
+                return {}
+            with open(file_path, 'rb') as f:
+                return fast_json.loads(f.read())
+        
+        with self._fd_lock:
+            try:
+                current_inode = os.stat(file_path).st_ino
+            except FileNotFoundError:
+                return {}
+            
+            fd = self._fds.get(file_type)
+            if fd is None or os.fstat(fd).st_ino != current_inode:
+                if fd is not None:
+                    os.close(fd)
+                fd = self._fds[file_type] = os.open(file_path, os.O_RDONLY)
+            
+            raw = os.pread(fd, os.fstat(fd).st_size, 0)
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return fast_json.loads(raw)
     
     def _write_json(self, file_type: str, data: Dict[str, Any]) -> None:
         """Write JSON file atomically."""
@@ -308,8 +361,8 @@ class FileManager:
         temp_path = file_path.with_suffix('.tmp')
         
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(temp_path, 'wb') as f:
+                f.write(fast_json.dumps(data, indent=True))
             
             # Atomic rename
             temp_path.replace(file_path)
@@ -319,6 +372,59 @@ class FileManager:
                 temp_path.unlink()
             raise e
     
+    # In-place edits, shared by the single-update methods and batched updates
+    
+    @staticmethod
+    def _append_turn_to(data: Dict[str, Any], speaker: str, turn_data: Dict[str, Any]) -> None:
+        """Append a turn to loaded history_chat data."""
+        # Determine if this goes to public_transcript or team_notes
+        if "statement" in turn_data:
+            # Main statement goes to public transcript
+            data["public_transcript"].append(turn_data)
+        
+        if "supplementary_material" in turn_data:
+            # Supplementary material goes to team notes
+            team_key = speaker.lower()
+            if team_key not in data["team_notes"]:
+                data["team_notes"][team_key] = []
+            data["team_notes"][team_key].append(turn_data)
+    
+    @staticmethod
+    def _add_citation_to(data: Dict[str, Any], team: str, citation_key: str, citation_data: Dict[str, Any]) -> None:
+        """Add a citation to loaded citation_pool data."""
+        team_key = f"team {team}"
+        if team_key not in data["citations"]:
+            data["citations"][team_key] = {}
+        
+        # Initialize verification if not present
+        if "verification" not in citation_data:
+            citation_data["verification"] = {
+                "source_credibility_score": None,
+                "content_correspondence_score": None,
+                "adversary_comment": None,
+                "proponent_response": None,
+                "verified_by": None,
+                "verified_at": None
+            }
+        
+        data["citations"][team_key][citation_key] = citation_data
+        
+        # Update round index
+        round_num = str(citation_data.get("added_in_round", 0))
+        if round_num not in data["index_by_round"]:
+            data["index_by_round"][round_num] = []
+        if citation_key not in data["index_by_round"][round_num]:
+            data["index_by_round"][round_num].append(citation_key)
+    
+    @staticmethod
+    def _update_verification_in(data: Dict[str, Any], team: str, citation_key: str, verification: Dict[str, Any]) -> None:
+        """Update a citation's verification in loaded citation_pool data."""
+        team_key = f"team {team}"
+        if team_key in data["citations"] and citation_key in data["citations"][team_key]:
+            data["citations"][team_key][citation_key]["verification"].update(verification)
+        else:
+            raise ValueError(f"Citation {citation_key} not found for {team_key}")
+    
     def _filter_data(self, data: Dict[str, Any], file_type: str, permissions: List[str]) -> Dict[str, Any]:
         """Filter data based on permissions."""
         if file_type == "history_chat":
@@ -0,0 +1,200 @@
+"""
+Log Reader - Streams entries from the JSONL logs written during a debate.
+
+Used by view_debate_log.py (debate_log.jsonl) and view_raw_calls.py
+(raw_model_calls.jsonl). Entries are yielded one at a time, so a viewer
+only holds the entry it is printing, however large the log grows. Viewer
+output goes through a large stdout buffer for the same reason.
+"""
+
+import io
+import json
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+from src.utils import fast_json
+
+
+# Bytes of the mapped log split per call in _iter_lines
+_SCAN_BLOCK = 1 << 20
+
+# Logs smaller than this aren't worth splitting across processes: starting
+# the workers costs more than scanning the file in-process
+PARALLEL_MIN_BYTES = 64 << 20
+
+
+def iter_jsonl(
+    path: Union[str, Path],
+    keep: Optional[Callable[[bytes], bool]] = None,
+    start: int = 0,
+    end: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield each entry of a JSONL file in file order.
+
+    Lines are parsed straight from bytes (with orjson when installed).
+    Blank lines and lines that fail to parse (e.g. a partially written last
+    line) are skipped.
+
+    Args:
+        path: Path to the .jsonl file
+        keep: Optional check on a line's raw bytes; lines it rejects are
+            skipped without being parsed. Use it as a cheap pre-filter
+            (e.g. a substring test) and still check the parsed entries.
+        start: Byte offset to start reading at (a line boundary)
+        end: Byte offset to stop reading at (a line boundary; default EOF)
+
+    Yields:
+        One parsed entry per line
+    """
+    for line in _iter_lines(path, start, end):
+        if not line.strip():
+            continue
+        if keep is not None and not keep(line):
+            continue
+        try:
+            yield fast_json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+
+
+def _iter_lines(
+    path: Union[str, Path],
+    start: int = 0,
+    end: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Yield the raw bytes of each non-empty line, without the newline.
+
+    The file is memory-mapped and cut into _SCAN_BLOCK slices, each split
+    on newlines by one bytes.split call, so boundaries are found in native
+    code rather than with a find() call per line. Lines are never decoded
+    or copied through a text-mode reader. Files that can't be mapped
+    (e.g. empty ones) are read line by line instead.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            f.seek(start)
+            for line in f:
+                if end is not None and start >= end:
+                    break
+                start += len(line)
+                yield line
+            return
+
+        with mm:
+            size = len(mm) if end is None else min(end, len(mm))
+            pending = []  # pieces of a line that runs across block boundaries
+            while start < size:
+                block = mm[start:min(start + _SCAN_BLOCK, size)]
+                start += _SCAN_BLOCK
+                lines = block.split(b"\n")
+                if len(lines) == 1:
+                    pending.append(block)
+                    continue
+                if pending:
+                    pending.append(lines[0])
+                    lines[0] = b"".join(pending)
+                    pending.clear()
+                pending.append(lines.pop())
+                yield from filter(None, lines)
+
+            tail = b"".join(pending)
+            if tail:
+                yield tail
+
+
+def chunk_ranges(path: Union[str, Path], parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into at most parts byte ranges that start and end on line
+    boundaries, so each range can be scanned on its own.
+
+    Args:
+        path: Path to the .jsonl file
+        parts: Number of ranges wanted
+
+    Returns:
+        (start, end) offsets covering the whole file, in order
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            f.seek(size * i // parts)
+            f.readline()  # move on to the start of the next line
+            offset = f.tell()
+            if bounds[-1] < offset < size:
+                bounds.append(offset)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def map_jsonl(
+    path: Union[str, Path],
+    worker: Callable[[Union[str, Path], int, int], Any],
+    workers: Optional[int] = None
+) -> Iterator[Any]:
+    """
+    Run worker(path, start, end) over line-aligned chunks of a file in
+    separate processes.
+
+    Each worker maps the file itself (e.g. via iter_jsonl(path, start=start,
+    end=end)), so no file data is sent to it. The worker must be a
+    module-level function (or a functools.partial of one) so it can be
+    pickled, and should return only what the caller needs, e.g. the entries
+    matching a filter.
+
+    Args:
+        path: Path to the .jsonl file
+        worker: Function scanning one byte range
+        workers: Number of processes (default: CPU count)
+
+    Yields:
+        Each chunk's result, in file order
+    """
+    ranges = chunk_ranges(path, workers or os.cpu_count() or 1)
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    with ProcessPoolExecutor(len(ranges)) as pool:
+        yield from pool.map(worker, [path] * len(ranges), starts, ends)
+
+
+@contextmanager
+def buffered_stdout(buffer_size: int = 1 << 20) -> Iterator[TextIO]:
+    """
+    Redirect stdout through a large write buffer.
+
+    print() and sys.stdout.write() inside the block reach the terminal in
+    buffer_size chunks instead of a write per line. The buffer is flushed
+    on exit and the real stdout is left open.
+
+    Args:
+        buffer_size: Bytes to accumulate before writing to stdout
+
+    Yields:
+        The buffered text stream (also installed as sys.stdout)
+    """
+    stdout = sys.stdout
+    if not hasattr(stdout, "buffer"):  # already replaced, e.g. by a StringIO
+        yield stdout
+        return
+
+    stdout.flush()
+    out = io.TextIOWrapper(
+        io.BufferedWriter(stdout.buffer, buffer_size),
+        encoding=stdout.encoding,
+        errors=stdout.errors
+    )
+    try:
+        with redirect_stdout(out):
+            yield out
+    finally:
+        out.flush()
+        out.detach().detach()  # unwrap without closing stdout.buffer
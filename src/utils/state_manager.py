@@ -27,7 +27,7 @@ class InvalidStateTransition(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class DebateState:
     """Tracks the current state of a debate."""
     
@@ -40,6 +40,7 @@ class DebateState:
     team_assignments: Dict[str, str] = field(default_factory=dict)  # {stance: team}
     resource_multiplier: float = 1.0
     audience_bias: float = 0.5  # 0.0 to 1.0 (0.5 = neutral)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     # Valid state transitions
     VALID_TRANSITIONS = {
@@ -50,6 +51,14 @@ class DebateState:
         DebatePhase.COMPLETED: []  # Terminal state
     }
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field and invalidate the cached to_dict() result."""
+        # object.__setattr__ because slots=True rebuilds the class, which
+        # breaks zero-argument super()
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+    
     def transition_to(self, new_phase: DebatePhase) -> None:
         """
         Transition to a new phase with validation.
@@ -186,34 +195,41 @@ class DebateState:
         return "b"
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert state to dictionary for serialization."""
-        return {
-            "debate_id": self.debate_id,
-            "topic": self.topic,
-            "phase": self.phase.value,
-            "round_number": self.round_number,
-            "turn_count": self.turn_count,
-            "current_speaker": self.current_speaker,
-            "team_assignments": self.team_assignments,
-            "resource_multiplier": self.resource_multiplier,
-            "audience_bias": self.audience_bias
-        }
+        """
+        Convert state to dictionary for serialization.
+        
+        The dict is rebuilt only after a field is reassigned; callers get a
+        shallow copy. Replace team_assignments rather than mutating it in
+        place, or the cache won't notice.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "debate_id": self.debate_id,
+                "topic": self.topic,
+                "phase": self.phase.value,
+                "round_number": self.round_number,
+                "turn_count": self.turn_count,
+                "current_speaker": self.current_speaker,
+                "team_assignments": self.team_assignments,
+                "resource_multiplier": self.resource_multiplier,
+                "audience_bias": self.audience_bias
+            }
+        return dict(self._dict_cache)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DebateState":
         """Create DebateState from dictionary."""
-        state = cls(
+        return cls(
             debate_id=data["debate_id"],
-            topic=data["topic"]
+            topic=data["topic"],
+            phase=DebatePhase(data["phase"]),
+            round_number=data["round_number"],
+            turn_count=data["turn_count"],
+            current_speaker=data["current_speaker"],
+            team_assignments=data["team_assignments"],
+            resource_multiplier=data["resource_multiplier"],
+            audience_bias=data["audience_bias"]
         )
-        state.phase = DebatePhase(data["phase"])
-        state.round_number = data["round_number"]
-        state.turn_count = data["turn_count"]
-        state.current_speaker = data["current_speaker"]
-        state.team_assignments = data["team_assignments"]
-        state.resource_multiplier = data["resource_multiplier"]
-        state.audience_bias = data["audience_bias"]
-        return state
     
     @classmethod
     def from_checkpoint(cls, checkpoint_state: Dict[str, Any]) -> "DebateState":
@@ -228,15 +244,14 @@ class DebateState:
         """
         # Note: checkpoint doesn't include debate_id and topic, so we need
         # to pass those separately. For now, use placeholder.
-        state = cls(
+        return cls(
             debate_id=checkpoint_state.get("debate_id", "unknown"),
-            topic=checkpoint_state.get("topic", "unknown")
+            topic=checkpoint_state.get("topic", "unknown"),
+            phase=DebatePhase(checkpoint_state["phase"]),
+            round_number=checkpoint_state["round_number"],
+            turn_count=checkpoint_state["turn_count"],
+            current_speaker=checkpoint_state.get("current_speaker"),
+            team_assignments=checkpoint_state["team_assignments"],
+            resource_multiplier=checkpoint_state["resource_multiplier"],
+            audience_bias=checkpoint_state.get("audience_bias", 0.5)
         )
-        state.phase = DebatePhase(checkpoint_state["phase"])
-        state.round_number = checkpoint_state["round_number"]
-        state.turn_count = checkpoint_state["turn_count"]
-        state.current_speaker = checkpoint_state.get("current_speaker")
-        state.team_assignments = checkpoint_state["team_assignments"]
-        state.resource_multiplier = checkpoint_state["resource_multiplier"]
-        state.audience_bias = checkpoint_state.get("audience_bias", 0.5)
-        return state
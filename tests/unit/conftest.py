@@ -0,0 +1,46 @@
+"""
+Shared setup for unit tests.
+
+The LLM SDKs (and requests) are replaced with lightweight stub modules before
+any client module is imported. Every unit test mocks these packages anyway, so
+importing the real SDKs only adds collection time.
+
+Tests reach the stubs through sys.modules, e.g.
+sys.modules['anthropic'].Anthropic.return_value = mock_anthropic
+
+Async tests share a module-scoped event loop rather than creating one each.
+"""
+
+import asyncio
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _stub_module(name: str, **attrs) -> types.ModuleType:
+    """Install a stub module under name with the given attributes."""
+    module = types.ModuleType(name)
+    for attr, value in attrs.items():
+        setattr(module, attr, value)
+    sys.modules[name] = module
+    return module
+
+
+_stub_module("anthropic", Anthropic=MagicMock())
+_stub_module("openai", OpenAI=MagicMock())
+_stub_module("requests", get=MagicMock(), post=MagicMock())
+
+_genai_types = _stub_module("google.genai.types")
+_genai = _stub_module("google.genai", Client=MagicMock(), types=_genai_types)
+_google = sys.modules.get("google") or _stub_module("google")
+_google.genai = _genai
+
+
+@pytest.fixture(scope="module")
+def event_loop():
+    """Share one event loop per test module instead of one per async test."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
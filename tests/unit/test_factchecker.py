@@ -17,12 +17,13 @@ from datetime import datetime
 from src.agents.factchecker import FactCheckerAgent
 from src.agents.base import AgentContext
 from src.config import Config
+from src.utils.file_manager import FileManager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_file_manager():
-    """Create a mock file manager."""
-    return Mock()
+    """Create a mock file manager restricted to the real FileManager API."""
+    return Mock(spec=FileManager)
 
 
 @pytest.fixture
@@ -170,6 +171,45 @@ class TestVerificationParsing:
         # Should clamp to valid range
         assert 1 <= verification["source_credibility_score"] <= 10
         assert 1 <= verification["content_correspondence_score"] <= 10
+    
+    def test_parse_verification_fallback_negative_score(self, factchecker_agent):
+        """Test that negative scores are read with their sign and clamped to 1."""
+        response = "Credibility: 6. Correspondence: -5. Bad source."
+        
+        verification = factchecker_agent._parse_verification_fallback(response)
+        
+        assert verification["source_credibility_score"] == 6
+        assert verification["content_correspondence_score"] == 1
+
+    def test_parse_verification_fallback_hyphenated_text(self, factchecker_agent):
+        """Test that hyphens between the keyword and the score are skipped."""
+        response = (
+            "Source credibility - 7/10. "
+            "Correspondence: peer-reviewed journal, score 9."
+        )
+
+        verification = factchecker_agent._parse_verification_fallback(response)
+
+        assert verification["source_credibility_score"] == 7
+        assert verification["content_correspondence_score"] == 9
+
+    def test_parse_verification_fallback_hyphenated_credibility(self, factchecker_agent):
+        """Test that a hyphenated word after the keyword doesn't hide the score."""
+        response = "Credibility: peer-reviewed journal, score 9. Correspondence - 4."
+
+        verification = factchecker_agent._parse_verification_fallback(response)
+
+        assert verification["source_credibility_score"] == 9
+        assert verification["content_correspondence_score"] == 4
+
+    def test_parse_verification_fallback_real_negative_score(self, factchecker_agent):
+        """Test that a minus sign directly before the digits is kept."""
+        response = "Credibility: -3. Correspondence score -8 overall."
+
+        verification = factchecker_agent._parse_verification_fallback(response)
+
+        assert verification["source_credibility_score"] == 1
+        assert verification["content_correspondence_score"] == 1
 
 
 @pytest.mark.asyncio
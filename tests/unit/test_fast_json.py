@@ -0,0 +1,63 @@
+"""
+Unit tests for the fast JSON helpers.
+
+Tests cover:
+- Round-trips with orjson and with the stdlib fallback
+- Indented output
+- Memory-mapped file loading
+- Decode errors
+"""
+
+import json
+
+import pytest
+from src.utils import fast_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test against both JSON backends."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(fast_json, "orjson", None)
+    elif fast_json.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestFastJson:
+    """Test encode/decode behaviour shared by both backends."""
+
+    def test_round_trip(self, backend):
+        """Test dumps returns bytes that loads parses back."""
+        data = {"topic": "Café prices", "turns": [1, 2.5, None, True]}
+        encoded = fast_json.dumps(data)
+
+        assert isinstance(encoded, bytes)
+        assert fast_json.loads(encoded) == data
+        assert fast_json.loads(encoded.decode("utf-8")) == data
+
+    def test_indent(self, backend):
+        """Test indented output puts nested keys on their own lines."""
+        encoded = fast_json.dumps({"state": {"round_number": 1}}, indent=True)
+
+        assert b'\n    "round_number": 1' in encoded
+
+    def test_invalid_json_raises(self, backend):
+        """Test decode errors are json.JSONDecodeError for either backend."""
+        with pytest.raises(json.JSONDecodeError):
+            fast_json.loads(b"{not json")
+
+    def test_load_file(self, backend, tmp_path):
+        """Test load_file parses a file through a memory map."""
+        path = tmp_path / "checkpoint.json"
+        path.write_bytes(fast_json.dumps({"turn_log_count": 3}, indent=True))
+
+        assert fast_json.load_file(path) == {"turn_log_count": 3}
+
+    def test_load_file_empty_raises(self, backend, tmp_path):
+        """Test an empty file is a decode error rather than an mmap error."""
+        path = tmp_path / "empty.json"
+        path.write_bytes(b"")
+
+        with pytest.raises(json.JSONDecodeError):
+            fast_json.load_file(path)
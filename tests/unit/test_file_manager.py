@@ -11,12 +11,18 @@ Tests cover:
 
 import pytest
 import json
+import os
+import shutil
 from pathlib import Path
-from datetime import datetime
+from types import SimpleNamespace
 
 from src.utils.file_manager import FileManager, PERMISSIONS
 
 
+# Fixed timestamp for citation/verification data; tests never assert on it
+_FROZEN_TS = "2024-01-01T00:00:00"
+
+
 @pytest.fixture
 def temp_debate_dir(tmp_path):
     """Create a temporary debate directory."""
@@ -31,6 +37,35 @@ def file_manager(temp_debate_dir):
     return FileManager(str(temp_debate_dir))
 
 
+@pytest.fixture(scope="session")
+def debate_template(tmp_path_factory):
+    """Initialize debate files once per session for tests to clone."""
+    template_dir = tmp_path_factory.mktemp("debate_template")
+    FileManager(str(template_dir)).initialize_files("test", "test topic")
+    return template_dir
+
+
+def _clone_template(template_dir, dest_dir):
+    """
+    Populate dest_dir with the template files.
+    
+    Hardlinks are used where supported: FileManager writes via temp file +
+    rename, so a write replaces the link instead of modifying the template.
+    """
+    for src in template_dir.iterdir():
+        if os.name != "nt":
+            os.link(src, dest_dir / src.name)
+        else:
+            shutil.copy2(src, dest_dir / src.name)
+
+
+@pytest.fixture
+def initialized_debate_dir(temp_debate_dir, debate_template):
+    """Debate directory pre-populated with initialized files."""
+    _clone_template(debate_template, temp_debate_dir)
+    return temp_debate_dir
+
+
 class TestInitialization:
     """Test FileManager initialization."""
     
@@ -64,15 +99,51 @@ class TestInitialization:
         assert "team_notes" in history
         assert "a" in history["team_notes"]
         assert "b" in history["team_notes"]
+    
+    def test_initializes_files_sequentially(self, file_manager, temp_debate_dir, monkeypatch):
+        """Test that initialize_files also works with parallel init disabled."""
+        monkeypatch.setattr(FileManager, "_PARALLEL_INIT", False)
+        
+        file_manager.initialize_files("test_123", "Should we test?")
+        
+        for file_type in ("history_chat", "citation_pool", "debate_latent", "crowd_opinion"):
+            assert file_manager._read_json(file_type)["debate_id"] == "test_123"
+        assert not list(temp_debate_dir.glob("*.tmp"))
+    
+    def test_initialize_files_is_idempotent(self, file_manager):
+        """Test that re-initializing the same debate keeps existing data."""
+        file_manager.initialize_files("test_123", "Should we test?")
+        file_manager.append_turn("a", {"turn_id": "turn_001", "statement": "Kept"})
+        
+        file_manager.initialize_files("test_123", "Should we test?")
+        
+        history = file_manager._read_json("history_chat")
+        assert len(history["public_transcript"]) == 1
+        
+        # A different debate_id resets the files
+        file_manager.initialize_files("other_456", "Should we test?")
+        
+        history = file_manager._read_json("history_chat")
+        assert history["debate_id"] == "other_456"
+        assert history["public_transcript"] == []
+    
+    def test_initialize_files_repairs_missing_file(self, file_manager, temp_debate_dir):
+        """Test that re-initializing rewrites the files if one is missing."""
+        file_manager.initialize_files("test_123", "Should we test?")
+        (temp_debate_dir / "citation_pool.json").unlink()
+        
+        file_manager.initialize_files("test_123", "Should we test?")
+        
+        for file_type in ("history_chat", "citation_pool", "debate_latent", "crowd_opinion"):
+            assert file_manager._read_json(file_type)["debate_id"] == "test_123"
 
 
 class TestPermissionFiltering:
     """Test permission-based filtering."""
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_debator_a_sees_own_team_notes(self, file_manager):
         """Test that debator_a can see team a notes but not team b."""
-        file_manager.initialize_files("test", "test topic")
-        
         # Add data
         data = file_manager._read_json("history_chat")
         data["team_notes"]["a"] = [{"material": "secret_a"}]
@@ -87,10 +158,9 @@ class TestPermissionFiltering:
         assert "b" not in filtered["team_notes"]
         assert filtered["team_notes"]["a"][0]["material"] == "secret_a"
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_debator_b_sees_own_team_notes(self, file_manager):
         """Test that debator_b can see team b notes but not team a."""
-        file_manager.initialize_files("test", "test topic")
-        
         # Add data
         data = file_manager._read_json("history_chat")
         data["team_notes"]["a"] = [{"material": "secret_a"}]
@@ -105,10 +175,9 @@ class TestPermissionFiltering:
         assert "a" not in filtered["team_notes"]
         assert filtered["team_notes"]["b"][0]["material"] == "secret_b"
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_judge_only_sees_public_transcript(self, file_manager):
         """Test that judge can only see public transcript, not team notes."""
-        file_manager.initialize_files("test", "test topic")
-        
         # Add data
         data = file_manager._read_json("history_chat")
         data["public_transcript"] = [{"statement": "public"}]
@@ -125,10 +194,9 @@ class TestPermissionFiltering:
         # Team notes should either not exist or be empty
         assert "team_notes" not in filtered or not filtered["team_notes"]
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_moderator_sees_everything(self, file_manager):
         """Test that moderator can see all data."""
-        file_manager.initialize_files("test", "test topic")
-        
         # Add data
         data = file_manager._read_json("history_chat")
         data["public_transcript"] = [{"statement": "public"}]
@@ -144,20 +212,29 @@ class TestPermissionFiltering:
         assert "a" in filtered["team_notes"]
         assert "b" in filtered["team_notes"]
     
-    def test_crowd_cannot_see_crowd_opinion(self, file_manager):
-        """Test that crowd agents cannot read crowd_opinion file."""
-        file_manager.initialize_files("test", "test topic")
+    @pytest.mark.usefixtures("initialized_debate_dir")
+    @pytest.mark.parametrize(
+        "file_type,setup",
+        [
+            ("crowd_opinion", lambda fm: None),
+            ("citation_pool", lambda fm: fm.add_citation(
+                "a", "a_1", {"source_url": "http://a.com", "added_in_round": 1}
+            )),
+        ],
+        ids=["crowd_opinion", "citation_pool"]
+    )
+    def test_crowd_has_no_access(self, file_manager, file_type, setup):
+        """Test that crowd agents cannot read crowd_opinion or citation_pool."""
+        setup(file_manager)
+        
+        # Crowd has empty permissions, so should return empty dict
+        filtered = file_manager.read_for_agent("crowd", file_type)
         
-        # Crowd has empty permissions for crowd_opinion
-        filtered = file_manager.read_for_agent("crowd", "crowd_opinion")
-        
-        # Should return empty dict (no access)
         assert filtered == {}
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_invalid_agent_raises_error(self, file_manager):
         """Test that invalid agent name raises ValueError."""
-        file_manager.initialize_files("test", "test topic")
-        
         with pytest.raises(ValueError, match="Unknown agent"):
             file_manager.read_for_agent("invalid_agent", "history_chat")
     
@@ -182,16 +259,15 @@ class TestCitationManagement:
         assert key3 == "b_1"
         assert key4 == "a_3"
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_add_citation(self, file_manager):
         """Test adding a citation to the pool."""
-        file_manager.initialize_files("test", "test topic")
-        
         citation_data = {
             "source_url": "http://example.com",
             "added_by": "debator_a",
             "added_in_turn": "turn_001",
             "added_in_round": 1,
-            "added_at": datetime.now().isoformat()
+            "added_at": _FROZEN_TS
         }
         
         file_manager.add_citation("a", "a_1", citation_data)
@@ -206,16 +282,15 @@ class TestCitationManagement:
         assert "verification" in pool["citations"]["team a"]["a_1"]
         assert pool["citations"]["team a"]["a_1"]["verification"]["source_credibility_score"] is None
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_add_citation_updates_round_index(self, file_manager):
         """Test that adding citation updates the round index."""
-        file_manager.initialize_files("test", "test topic")
-        
         citation_data = {
             "source_url": "http://example.com",
             "added_by": "debator_a",
             "added_in_turn": "turn_001",
             "added_in_round": 1,
-            "added_at": datetime.now().isoformat()
+            "added_at": _FROZEN_TS
         }
         
         file_manager.add_citation("a", "a_1", citation_data)
@@ -224,10 +299,9 @@ class TestCitationManagement:
         assert "1" in pool["index_by_round"]
         assert "a_1" in pool["index_by_round"]["1"]
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_update_verification(self, file_manager):
         """Test updating verification scores."""
-        file_manager.initialize_files("test", "test topic")
-        
         # Add citation
         citation_data = {
             "source_url": "http://example.com",
@@ -243,7 +317,7 @@ class TestCitationManagement:
             "content_correspondence_score": 9,
             "adversary_comment": "Good source",
             "verified_by": "factchecker_b",
-            "verified_at": datetime.now().isoformat()
+            "verified_at": _FROZEN_TS
         }
         file_manager.update_verification("a", "a_1", verification)
         
@@ -255,10 +329,9 @@ class TestCitationManagement:
         assert ver["adversary_comment"] == "Good source"
         assert ver["verified_by"] == "factchecker_b"
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_update_verification_nonexistent_citation_raises_error(self, file_manager):
         """Test that updating nonexistent citation raises ValueError."""
-        file_manager.initialize_files("test", "test topic")
-        
         verification = {"source_credibility_score": 8}
         
         with pytest.raises(ValueError, match="Citation .* not found"):
@@ -268,10 +341,9 @@ class TestCitationManagement:
 class TestFileOperations:
     """Test file read/write/append operations."""
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_atomic_write(self, file_manager, temp_debate_dir):
         """Test that writes are atomic (temp file is used)."""
-        file_manager.initialize_files("test", "test topic")
-        
         data = {"test": "data"}
         file_manager.write_by_moderator("history_chat", data)
         
@@ -283,10 +355,19 @@ class TestFileOperations:
         written_data = file_manager._read_json("history_chat")
         assert written_data["test"] == "data"
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
+    def test_write_does_not_modify_template(self, file_manager, debate_template):
+        """Test that writing a cloned file leaves the shared template intact."""
+        file_manager.write_by_moderator("history_chat", {"test": "data"})
+        
+        with open(debate_template / "history_chat.json", 'r', encoding='utf-8') as f:
+            template_data = json.load(f)
+        assert "test" not in template_data
+        assert template_data["debate_id"] == "test"
+    
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_append_turn_to_public_transcript(self, file_manager):
         """Test appending a turn with statement to public transcript."""
-        file_manager.initialize_files("test", "test topic")
-        
         turn_data = {
             "turn_id": "turn_001",
             "speaker": "a",
@@ -301,10 +382,9 @@ class TestFileOperations:
         assert len(history["public_transcript"]) == 1
         assert history["public_transcript"][0]["statement"] == "My argument..."
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_append_supplementary_material_to_team_notes(self, file_manager):
         """Test appending supplementary material to team notes."""
-        file_manager.initialize_files("test", "test topic")
-        
         turn_data = {
             "turn_id": "turn_001",
             "supplementary_material": "Internal notes...",
@@ -317,6 +397,47 @@ class TestFileOperations:
         assert len(history["team_notes"]["a"]) == 1
         assert history["team_notes"]["a"][0]["supplementary_material"] == "Internal notes..."
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
+    def test_read_sees_writes_from_other_managers(self, file_manager, temp_debate_dir):
+        """Test that a cached read handle is refreshed after the file is replaced."""
+        assert file_manager._read_json("history_chat")["debate_id"] == "test"
+        
+        FileManager(str(temp_debate_dir)).write_by_moderator("history_chat", {"test": "data"})
+        
+        assert file_manager._read_json("history_chat") == {"test": "data"}
+        
+        file_manager.close_all()
+        assert file_manager._read_json("history_chat") == {"test": "data"}
+    
+    @pytest.mark.usefixtures("initialized_debate_dir")
+    def test_apply_updates_writes_each_file_once(self, file_manager, monkeypatch):
+        """Test that batched updates share one read/write per target file."""
+        updates = [
+            SimpleNamespace(file_type="history_chat", data={"statement": "First"}),
+            SimpleNamespace(file_type="debate_latent", data={"round": 1}),
+            SimpleNamespace(file_type="history_chat", data={"statement": "Second"}),
+        ]
+        
+        def apply(data, update):
+            if update.file_type == "history_chat":
+                file_manager._append_turn_to(data, "a", update.data)
+            else:
+                data["round_history"].append(update.data)
+        
+        writes = []
+        write_json = file_manager._write_json
+        monkeypatch.setattr(
+            file_manager, "_write_json",
+            lambda file_type, data: (writes.append(file_type), write_json(file_type, data))
+        )
+        
+        file_manager.apply_updates(updates, apply)
+        
+        assert sorted(writes) == ["debate_latent", "history_chat"]
+        history = file_manager._read_json("history_chat")
+        assert [t["statement"] for t in history["public_transcript"]] == ["First", "Second"]
+        assert file_manager._read_json("debate_latent")["round_history"] == [{"round": 1}]
+    
     def test_read_nonexistent_file_returns_empty_dict(self, file_manager):
         """Test that reading nonexistent file returns empty dict."""
         result = file_manager._read_json("history_chat")
@@ -331,10 +452,9 @@ class TestFileOperations:
 class TestCitationPoolFiltering:
     """Test citation pool permission filtering."""
     
+    @pytest.mark.usefixtures("initialized_debate_dir")
     def test_debators_see_all_citations(self, file_manager):
         """Test that debators can see both teams' citations."""
-        file_manager.initialize_files("test", "test topic")
-        
         # Add citations for both teams
         file_manager.add_citation("a", "a_1", {"source_url": "http://a.com", "added_in_round": 1})
         file_manager.add_citation("b", "b_1", {"source_url": "http://b.com", "added_in_round": 1})
@@ -346,23 +466,12 @@ class TestCitationPoolFiltering:
         assert "team b" in filtered["citations"]
         assert "a_1" in filtered["citations"]["team a"]
         assert "b_1" in filtered["citations"]["team b"]
-    
-    def test_crowd_cannot_see_citations(self, file_manager):
-        """Test that crowd has no access to citation_pool."""
-        file_manager.initialize_files("test", "test topic")
-        
-        file_manager.add_citation("a", "a_1", {"source_url": "http://a.com", "added_in_round": 1})
-        
-        # Read as crowd
-        filtered = file_manager.read_for_agent("crowd", "citation_pool")
-        
-        # Should return empty (no permissions)
-        assert filtered == {}
 
 
 class TestThreadSafety:
     """Test thread safety of citation counter."""
     
+    @pytest.mark.slow
     def test_citation_counter_thread_safe(self, file_manager):
         """Test that citation counter is thread-safe."""
         import threading
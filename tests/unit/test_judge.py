@@ -10,10 +10,11 @@ Tests cover:
 - File updates
 """
 
+import dataclasses
 import pytest
 import json
 import re
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock
 from datetime import datetime
 
 from src.agents.judge import JudgeAgent
@@ -21,28 +22,84 @@ from src.agents.base import AgentContext, FileUpdateOperation
 from src.config import Config
 
 
-@pytest.fixture
-def mock_file_manager():
-    """Create a mock file manager."""
-    return Mock()
+# Judge prompt must say it is not deciding a winner
+NEUTRALITY_RE = re.compile(r'not.*(?:winning|decide)')
+
+# Valid Claude output for the mocked execute_turn test
+MOCK_JUDGE_RESPONSE = json.dumps({
+    "consensus": ["Both agree on the importance of evidence"],
+    "disagreement_frontier": [
+        {
+            "core_issue": "Economic feasibility",
+            "a_stance": "Cost-effective solution",
+            "b_stance": "Too expensive to implement"
+        }
+    ]
+})
+
+
+class FakeFileManager:
+    """In-memory stand-in for FileManager backed by a plain dict."""
+    
+    __slots__ = ("_state",)
+    
+    def __init__(self):
+        self._state = {}
+    
+    def read_for_agent(self, agent_name, file_type):
+        return self._state.get(file_type, {})
+    
+    def write_by_moderator(self, file_type, data):
+        self._state[file_type] = data
+    
+    def reset(self):
+        self._state.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def fake_file_manager():
+    """Create an in-memory file manager."""
+    return FakeFileManager()
+
+
+@pytest.fixture(scope="module")
 def test_config():
     """Create test configuration."""
     return Config.test_config()
 
 
-@pytest.fixture
-def judge_agent(mock_file_manager, test_config):
-    """Create a judge agent instance."""
+@pytest.fixture(scope="module")
+def judge_agent(fake_file_manager, test_config):
+    """Create a judge agent instance shared across the module."""
     return JudgeAgent(
         name="judge",
-        file_manager=mock_file_manager,
+        file_manager=fake_file_manager,
         config=test_config
     )
 
 
+@pytest.fixture(scope="module")
+def base_context():
+    """Minimal opening-round context; tests derive variants with dataclasses.replace."""
+    return AgentContext(
+        debate_id="test",
+        topic="",
+        phase="opening",
+        round_number=1,
+        current_state={"history_chat": {"public_transcript": []}},
+        instructions=""
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_judge(judge_agent, fake_file_manager):
+    """Undo per-test mocking on the shared judge agent."""
+    yield
+    # Drop instance overrides so the real ClaudeClient.generate is visible again
+    vars(judge_agent.claude).pop("generate", None)
+    fake_file_manager.reset()
+
+
 class TestJudgeInitialization:
     """Test judge agent initialization."""
     
@@ -68,19 +125,17 @@ class TestSystemPrompt:
         assert "consensus" in prompt_lower
         assert "disagreement" in prompt_lower
         # Check for neutrality emphasis (not deciding winner)
-        assert re.search(r'not.*(?:winning|decide)', prompt_lower) is not None
+        assert NEUTRALITY_RE.search(prompt_lower) is not None
 
 
 class TestAnalysisPromptBuilding:
     """Test building analysis prompts."""
     
-    def test_build_analysis_prompt_with_transcript(self, judge_agent):
+    def test_build_analysis_prompt_with_transcript(self, judge_agent, base_context):
         """Test building prompt with debate transcript."""
-        context = AgentContext(
-            debate_id="test",
+        context = dataclasses.replace(
+            base_context,
             topic="Should we implement UBI?",
-            phase="opening",
-            round_number=1,
             current_state={
                 "history_chat": {
                     "public_transcript": [
@@ -107,16 +162,9 @@ class TestAnalysisPromptBuilding:
         assert "UBI causes inflation" in prompt
         assert "Team a" in prompt or "Team b" in prompt
     
-    def test_build_analysis_prompt_empty_transcript(self, judge_agent):
+    def test_build_analysis_prompt_empty_transcript(self, judge_agent, base_context):
         """Test building prompt with no transcript yet."""
-        context = AgentContext(
-            debate_id="test",
-            topic="Test topic",
-            phase="opening",
-            round_number=1,
-            current_state={"history_chat": {"public_transcript": []}},
-            instructions="Analyze"
-        )
+        context = dataclasses.replace(base_context, topic="Test topic", instructions="Analyze")
         
         prompt = judge_agent._build_analysis_prompt(context)
         
@@ -187,13 +235,11 @@ Issue: Effect on innovation
 class TestJudgeExecution:
     """Test judge turn execution (with mocks)."""
     
-    async def test_execute_turn_with_mock_claude(self, judge_agent):
+    async def test_execute_turn_with_mock_claude(self, judge_agent, base_context):
         """Test executing a turn with mocked Claude."""
-        context = AgentContext(
-            debate_id="test",
+        context = dataclasses.replace(
+            base_context,
             topic="Test topic",
-            phase="opening",
-            round_number=1,
             current_state={
                 "history_chat": {
                     "public_transcript": [
@@ -205,20 +251,8 @@ class TestJudgeExecution:
             instructions="Analyze debate"
         )
         
-        # Mock Claude response with valid JSON
-        mock_response = json.dumps({
-            "consensus": ["Both agree on the importance of evidence"],
-            "disagreement_frontier": [
-                {
-                    "core_issue": "Economic feasibility",
-                    "a_stance": "Cost-effective solution",
-                    "b_stance": "Too expensive to implement"
-                }
-            ]
-        })
-        
-        with patch.object(judge_agent.claude, 'generate', return_value=mock_response):
-            response = await judge_agent.execute_turn(context)
+        judge_agent.claude.generate = AsyncMock(return_value=MOCK_JUDGE_RESPONSE)
+        response = await judge_agent.execute_turn(context)
         
         assert response.success is True
         assert "consensus" in response.output
@@ -226,20 +260,18 @@ class TestJudgeExecution:
         assert len(response.file_updates) == 1
         assert response.file_updates[0].file_type == "debate_latent"
     
-    async def test_execute_turn_handles_errors(self, judge_agent):
+    async def test_execute_turn_handles_errors(self, judge_agent, base_context):
         """Test that errors are handled gracefully."""
-        context = AgentContext(
-            debate_id="test",
+        context = dataclasses.replace(
+            base_context,
             topic="test",
-            phase="opening",
-            round_number=1,
             current_state={},
             instructions="test"
         )
         
         # Mock Claude to raise error
-        with patch.object(judge_agent.claude, 'generate', side_effect=Exception("API Error")):
-            response = await judge_agent.execute_turn(context)
+        judge_agent.claude.generate = AsyncMock(side_effect=Exception("API Error"))
+        response = await judge_agent.execute_turn(context)
         
         assert response.success is False
         assert len(response.errors) > 0
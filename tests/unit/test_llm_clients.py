@@ -9,25 +9,49 @@ Tests cover:
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, AsyncMock
-from src.clients.gemini_client import GeminiClient
-from src.clients.claude_client import ClaudeClient
-from src.clients.perplexity_client import PerplexityClient
-from src.clients.lambda_client import LambdaGPUClient
 from src.clients.mcp_client import MCPBrowserClient, MockMCPClient, SearchResult
 
 
+@pytest.fixture(scope="module")
+def gemini_client_cls():
+    """Import GeminiClient lazily so collecting this module stays cheap."""
+    from src.clients.gemini_client import GeminiClient
+    return GeminiClient
+
+
+@pytest.fixture(scope="module")
+def claude_client_cls():
+    """Import ClaudeClient lazily so collecting this module stays cheap."""
+    from src.clients.claude_client import ClaudeClient
+    return ClaudeClient
+
+
+@pytest.fixture(scope="module")
+def perplexity_client_cls():
+    """Import PerplexityClient lazily so collecting this module stays cheap."""
+    from src.clients.perplexity_client import PerplexityClient
+    return PerplexityClient
+
+
+@pytest.fixture(scope="module")
+def lambda_client_cls():
+    """Import LambdaGPUClient lazily so collecting this module stays cheap."""
+    from src.clients.lambda_client import LambdaGPUClient
+    return LambdaGPUClient
+
+
 class TestGeminiClient:
     """Test Gemini client (Interactions API)."""
     
-    def test_initialization(self):
+    def test_initialization(self, gemini_client_cls):
         """Test Gemini client initialization."""
-        with patch('google.genai.Client'):
-            client = GeminiClient("test_key")
-            assert client.model_name == "gemini-2.5-flash"
+        client = gemini_client_cls("test_key")
+        assert client.model_name == "gemini-2.5-flash"
     
     @pytest.mark.asyncio
-    async def test_generate_mock(self):
+    async def test_generate_mock(self, gemini_client_cls):
         """Test generate method with Interactions API."""
         mock_client = Mock()
         mock_interaction = Mock()
@@ -37,23 +61,22 @@ class TestGeminiClient:
         mock_interaction.outputs = [mock_output]
         mock_client.interactions.create.return_value = mock_interaction
         
-        with patch('google.genai.Client', return_value=mock_client):
-            client = GeminiClient("test_key")
-            result = await client.generate("Test prompt")
-            assert result == "Generated response"
+        client = gemini_client_cls("test_key")
+        client.client = mock_client
+        result = await client.generate("Test prompt")
+        assert result == "Generated response"
 
 
 class TestClaudeClient:
     """Test Claude client."""
     
-    def test_initialization(self):
+    def test_initialization(self, claude_client_cls):
         """Test Claude client initialization."""
-        with patch('anthropic.Anthropic'):
-            client = ClaudeClient("test_key")
-            assert client.model == "claude-3-5-sonnet-20241022"
+        client = claude_client_cls("test_key")
+        assert client.model == "claude-3-5-sonnet-20241022"
     
     @pytest.mark.asyncio
-    async def test_generate_mock(self):
+    async def test_generate_mock(self, claude_client_cls):
         """Test generate method with mock."""
         mock_anthropic = Mock()
         mock_response = Mock()
@@ -62,24 +85,22 @@ class TestClaudeClient:
         mock_response.content = [mock_content]
         mock_anthropic.messages.create.return_value = mock_response
         
-        with patch('anthropic.Anthropic', return_value=mock_anthropic):
-            client = ClaudeClient("test_key")
-            client.client = mock_anthropic  # Override with mock
-            result = await client.generate("Test prompt")
-            assert result == "Claude response"
+        client = claude_client_cls("test_key")
+        client.client = mock_anthropic  # Override with mock
+        result = await client.generate("Test prompt")
+        assert result == "Claude response"
 
 
 class TestPerplexityClient:
     """Test Perplexity client."""
     
-    def test_initialization(self):
+    def test_initialization(self, perplexity_client_cls):
         """Test Perplexity client initialization."""
-        with patch('openai.OpenAI'):
-            client = PerplexityClient("test_key")
-            assert client.model == "sonar-pro"
+        client = perplexity_client_cls("test_key")
+        assert client.model == "sonar-pro"
     
     @pytest.mark.asyncio
-    async def test_chat_mock(self):
+    async def test_chat_mock(self, perplexity_client_cls):
         """Test chat method with mock."""
         mock_openai = Mock()
         mock_response = Mock()
@@ -90,15 +111,14 @@ class TestPerplexityClient:
         mock_response.choices = [mock_choice]
         mock_openai.chat.completions.create.return_value = mock_response
         
-        with patch('openai.OpenAI', return_value=mock_openai):
-            client = PerplexityClient("test_key")
-            client.client = mock_openai  # Override with mock
-            messages = [{"role": "user", "content": "Verify this claim"}]
-            result = await client.chat(messages, search_recency_filter=None)  # Don't use filter in test
-            assert result == "Perplexity response with citations"
+        client = perplexity_client_cls("test_key")
+        client.client = mock_openai  # Override with mock
+        messages = [{"role": "user", "content": "Verify this claim"}]
+        result = await client.chat(messages, search_recency_filter=None)  # Don't use filter in test
+        assert result == "Perplexity response with citations"
     
     @pytest.mark.asyncio
-    async def test_verify_source(self):
+    async def test_verify_source(self, perplexity_client_cls):
         """Test verify_source method."""
         mock_openai = Mock()
         mock_response = Mock()
@@ -109,32 +129,31 @@ class TestPerplexityClient:
         mock_response.choices = [mock_choice]
         mock_openai.chat.completions.create.return_value = mock_response
         
-        with patch('openai.OpenAI', return_value=mock_openai):
-            client = PerplexityClient("test_key")
-            client.client = mock_openai  # Override with mock
-            result = await client.verify_source("http://example.com", "Test claim")
-            assert "raw_response" in result
+        client = perplexity_client_cls("test_key")
+        client.client = mock_openai  # Override with mock
+        result = await client.verify_source("http://example.com", "Test claim")
+        assert "raw_response" in result
 
 
 class TestLambdaGPUClient:
     """Test Lambda GPU client."""
     
-    def test_initialization(self):
+    def test_initialization(self, lambda_client_cls):
         """Test Lambda GPU client initialization."""
-        client = LambdaGPUClient("http://localhost:8000", "test_key")
+        client = lambda_client_cls("http://localhost:8000", "test_key")
         assert client.endpoint == "http://localhost:8000"
         assert "Authorization" in client.headers
     
-    def test_initialization_without_api_key(self):
+    def test_initialization_without_api_key(self, lambda_client_cls):
         """Test initialization without API key."""
-        client = LambdaGPUClient("http://localhost:8000")
+        client = lambda_client_cls("http://localhost:8000")
         assert client.endpoint == "http://localhost:8000"
         assert client.headers == {}
     
     @pytest.mark.asyncio
-    async def test_generate_batch_mock(self):
+    async def test_generate_batch_mock(self, lambda_client_cls):
         """Test batch generation with mock."""
-        client = LambdaGPUClient("http://localhost:8000")
+        client = lambda_client_cls("http://localhost:8000")
         
         # Mock the method directly
         with patch.object(client, 'generate_batch', return_value=["Response 1", "Response 2", "Response 3"]):
@@ -143,32 +162,46 @@ class TestLambdaGPUClient:
             assert results[0] == "Response 1"
     
     @pytest.mark.asyncio
-    async def test_generate_single_mock(self):
+    async def test_generate_single_mock(self, lambda_client_cls):
         """Test single generation with mock."""
-        client = LambdaGPUClient("http://localhost:8000")
+        client = lambda_client_cls("http://localhost:8000")
         
         # Mock the method directly
         with patch.object(client, 'generate_batch', return_value=["Single response"]):
             result = await client.generate_single("Test prompt")
             assert result == "Single response"
     
-    def test_health_check_success(self):
+    def test_health_check_success(self, lambda_client_cls, monkeypatch):
         """Test health check when endpoint is healthy."""
-        client = LambdaGPUClient("http://localhost:8000")
+        client = lambda_client_cls("http://localhost:8000")
+        monkeypatch.setattr(
+            "src.clients.lambda_client.requests.get",
+            lambda *args, **kwargs: SimpleNamespace(status_code=200)
+        )
         
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_get.return_value = mock_response
-            
-            assert client.health_check() is True
+        assert client.health_check() is True
     
-    def test_health_check_failure(self):
+    def test_health_check_failure(self, lambda_client_cls, monkeypatch):
         """Test health check when endpoint is down."""
-        client = LambdaGPUClient("http://localhost:8000")
+        client = lambda_client_cls("http://localhost:8000")
+        
+        def _raise(*args, **kwargs):
+            raise Exception("Connection failed")
+        
+        monkeypatch.setattr("src.clients.lambda_client.requests.get", _raise)
         
-        with patch('requests.get', side_effect=Exception("Connection failed")):
-            assert client.health_check() is False
+        assert client.health_check() is False
+
+
+@pytest.fixture(scope="module")
+def mcp_client():
+    """Shared MCP client with primed search and page caches."""
+    client = MCPBrowserClient()
+    client.search_cache["test query:10"] = [
+        SearchResult(url="http://a.com", title="A", snippet="cached")
+    ]
+    client.page_cache["http://example.com"] = "Cached content"
+    return client
 
 
 class TestMCPClient:
@@ -182,30 +215,19 @@ class TestMCPClient:
         assert client.page_cache == {}
     
     @pytest.mark.asyncio
-    async def test_search_caching(self):
+    async def test_search_caching(self, mcp_client):
         """Test that search results are cached."""
-        client = MCPBrowserClient()
+        results = await mcp_client.search("test query")
         
-        # First call
-        results1 = await client.search("test query")
-        
-        # Second call should return cached results
-        results2 = await client.search("test query")
-        
-        assert results1 == results2
+        # Should return the cached list itself, not a fresh search
+        assert results is mcp_client.search_cache["test query:10"]
     
     @pytest.mark.asyncio
-    async def test_read_page_caching(self):
+    async def test_read_page_caching(self, mcp_client):
         """Test that page content is cached."""
-        client = MCPBrowserClient()
-        
-        # First call
-        content1 = await client.read_page("http://example.com")
-        
-        # Second call should return cached content
-        content2 = await client.read_page("http://example.com")
+        content = await mcp_client.read_page("http://example.com")
         
-        assert content1 == content2
+        assert content == "Cached content"
     
     def test_clear_cache(self):
         """Test clearing caches."""
@@ -0,0 +1,163 @@
+"""
+Unit tests for the JSONL log reader.
+
+Tests cover:
+- Streaming entries in file order
+- Skipping blank and malformed lines
+- Files without a trailing newline or with CRLF endings
+- Lines spanning scan blocks
+- Line-aligned chunks scanned in worker processes
+- orjson and stdlib parsing
+- Buffered stdout for viewer output
+"""
+
+import json
+import sys
+import types
+
+import pytest
+from src.utils import fast_json, log_reader
+from src.utils.log_reader import buffered_stdout, chunk_ranges, iter_jsonl, map_jsonl
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Parse with both JSON backends."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(fast_json, "orjson", None)
+    elif fast_json.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Write a small JSONL log with a blank and a truncated line."""
+    path = tmp_path / "debate_log.jsonl"
+    lines = [
+        json.dumps({"type": "agent_turn", "agent": {"name": "debator_a"}}, ensure_ascii=False),
+        "",
+        json.dumps({"type": "llm_request", "agent": "judge", "prompt_preview": "Café"}, ensure_ascii=False),
+        '{"type": "system", "eve',
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+class TestIterJsonl:
+    """Test streaming JSONL parsing."""
+
+    def test_is_lazy(self, log_file):
+        """Test that entries are produced by a generator, not a list."""
+        assert isinstance(iter_jsonl(log_file), types.GeneratorType)
+
+    def test_yields_entries_in_order(self, backend, log_file):
+        """Test that valid lines are parsed in file order."""
+        entries = list(iter_jsonl(log_file))
+
+        assert [e["type"] for e in entries] == ["agent_turn", "llm_request"]
+        assert entries[1]["prompt_preview"] == "Café"
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty log yields nothing."""
+        path = tmp_path / "empty.jsonl"
+        path.write_bytes(b"")
+
+        assert list(iter_jsonl(path)) == []
+
+    def test_last_line_without_newline(self, backend, tmp_path):
+        """Test that a final line without a newline and CRLF endings parse."""
+        path = tmp_path / "raw_model_calls.jsonl"
+        path.write_bytes(b'{"model": "a"}\r\n{"model": "b"}')
+
+        assert [e["model"] for e in iter_jsonl(path)] == ["a", "b"]
+
+    def test_invalid_utf8_line_skipped(self, backend, tmp_path):
+        """Test that a line with invalid UTF-8 is skipped like malformed JSON."""
+        path = tmp_path / "debate_log.jsonl"
+        path.write_bytes(b'{"type": "\xff"}\n{"type": "system"}\n')
+
+        assert [e["type"] for e in iter_jsonl(path)] == ["system"]
+
+    def test_keep_skips_rejected_lines_unparsed(self, backend, log_file, monkeypatch):
+        """Test that lines rejected by keep are never handed to the parser."""
+        parsed = []
+        loads = fast_json.loads
+        monkeypatch.setattr(fast_json, "loads", lambda line: parsed.append(line) or loads(line))
+
+        entries = list(iter_jsonl(log_file, keep=lambda line: b'"judge"' in line))
+
+        assert [e["agent"] for e in entries] == ["judge"]
+        assert len(parsed) == 1
+
+    @pytest.mark.parametrize("block_size", [1, 7, 64])
+    def test_lines_spanning_scan_blocks(self, tmp_path, monkeypatch, block_size):
+        """Test that lines cut by scan block boundaries are rejoined."""
+        monkeypatch.setattr(log_reader, "_SCAN_BLOCK", block_size)
+        entries = [{"turn": i, "text": "x" * (i * 13)} for i in range(6)]
+        path = tmp_path / "debate_log.jsonl"
+        path.write_text("\n\n".join(json.dumps(e) for e in entries) + "\n", encoding="utf-8")
+
+        assert list(iter_jsonl(path)) == entries
+
+
+def _turns_in_range(path, start, end):
+    """map_jsonl worker used by the tests (module-level so it pickles)."""
+    return [entry["turn"] for entry in iter_jsonl(path, start=start, end=end)]
+
+
+class TestChunkedScan:
+    """Test splitting a log into line-aligned byte ranges."""
+
+    @pytest.fixture
+    def turns_file(self, tmp_path):
+        """Write a log of uneven line lengths."""
+        path = tmp_path / "raw_model_calls.jsonl"
+        path.write_text(
+            "".join(json.dumps({"turn": i, "text": "x" * (i * 7 % 50)}) + "\n" for i in range(40)),
+            encoding="utf-8"
+        )
+        return path
+
+    @pytest.mark.parametrize("parts", [1, 3, 8, 1000])
+    def test_ranges_cover_file_on_line_boundaries(self, turns_file, parts):
+        """Test that ranges are contiguous and every range starts a line."""
+        data = turns_file.read_bytes()
+        ranges = chunk_ranges(turns_file, parts)
+
+        assert 1 <= len(ranges) <= parts
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+        assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+        assert all(data[start - 1:start] == b"\n" for start, _ in ranges[1:])
+
+    def test_ranges_read_every_entry_once(self, turns_file):
+        """Test that scanning each range separately yields the whole log in order."""
+        turns = [
+            entry["turn"]
+            for start, end in chunk_ranges(turns_file, 5)
+            for entry in iter_jsonl(turns_file, start=start, end=end)
+        ]
+
+        assert turns == list(range(40))
+
+    def test_map_jsonl_results_in_file_order(self, turns_file):
+        """Test that worker results come back in file order."""
+        results = list(map_jsonl(turns_file, _turns_in_range, workers=4))
+
+        assert [turn for chunk in results for turn in chunk] == list(range(40))
+
+
+class TestBufferedStdout:
+    """Test the viewers' buffered output stream."""
+
+    def test_output_flushed_and_stdout_restored(self, capsys):
+        """Test that buffered writes reach stdout and stdout stays usable."""
+        stdout = sys.stdout
+        with buffered_stdout() as out:
+            assert sys.stdout is out
+            print("Debate ID: é")
+            sys.stdout.write("done\n")
+
+        assert sys.stdout is stdout
+        print("after")
+        assert capsys.readouterr().out == "Debate ID: é\ndone\nafter\n"
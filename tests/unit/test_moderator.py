@@ -10,9 +10,14 @@ Tests:
 - Output generation
 """
 
+import asyncio
+import copy
+import dataclasses
+import errno
 import json
+import shutil
+import threading
 import pytest
-from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime
 
@@ -20,22 +25,39 @@ from src.moderator import DebateModerator
 from src.config import Config
 from src.agents.base import AgentResponse, FileUpdate, FileUpdateOperation
 from src.utils.state_manager import DebatePhase
+from src.utils.file_manager import FileManager
+from src.utils.debate_logger import DebateLogger
+from src.utils.raw_data_logger import RawDataLogger
 
 
-@pytest.fixture
-def test_config():
+@pytest.fixture(scope="module")
+def test_config(tmp_path_factory):
     """Create test configuration."""
     config = Config(
         gemini_api_key="test-gemini-key",
         claude_api_key="test-claude-key",
         perplexity_api_key="test-perplexity-key",
         lambda_gpu_endpoint="http://test-lambda:8000",
-        num_debate_rounds=2
+        num_debate_rounds=2,
+        debates_root=tmp_path_factory.mktemp("debates")
     )
     return config
 
 
-@pytest.fixture
+# Shared by every mock agent; tuples so accidental mutation raises
+DEFAULT_RESPONSE = AgentResponse(
+    agent_name="",
+    success=True,
+    output={
+        "_cost_estimate": 0.05,
+        "test": "data"
+    },
+    file_updates=(),
+    errors=()
+)
+
+
+@pytest.fixture(scope="module")
 def mock_agents():
     """Create mock agents that return successful responses."""
     
@@ -43,16 +65,7 @@ def mock_agents():
         agent = Mock()
         agent.name = name
         agent.read_state = Mock(return_value={})
-        agent.execute_turn = AsyncMock(return_value=AgentResponse(
-            agent_name=name,
-            success=True,
-            output={
-                "_cost_estimate": 0.05,
-                "test": "data"
-            },
-            file_updates=[],
-            errors=[]
-        ))
+        agent.execute_turn = AsyncMock(return_value=DEFAULT_RESPONSE)
         return agent
     
     return {
@@ -65,12 +78,58 @@ def mock_agents():
     }
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_agents(request):
+    """Restore the shared mock agents after tests that use them."""
+    yield
+    if "mock_agents" in request.fixturenames:
+        for agent in request.getfixturevalue("mock_agents").values():
+            agent.reset_mock()
+            agent.execute_turn = AsyncMock(return_value=DEFAULT_RESPONSE)
+
+
+@pytest.fixture(scope="module")
+def base_moderator(test_config):
+    """Construct one DebateModerator per module for tests to copy."""
+    return DebateModerator(topic="Test", config=test_config)
+
+
+@pytest.fixture(scope="module")
+def initialized_debate_template(base_moderator, tmp_path_factory):
+    """Debate files initialized once for the base moderator, copied per test."""
+    template_dir = tmp_path_factory.mktemp("debate_template")
+    FileManager(str(template_dir)).initialize_files(base_moderator.debate_id, "Test")
+    return template_dir
+
+
 @pytest.fixture
-def temp_debate_dir(tmp_path):
-    """Create temporary debate directory."""
-    debate_dir = tmp_path / "debates" / "test-debate-id"
-    debate_dir.mkdir(parents=True)
-    return debate_dir
+def moderator(base_moderator, initialized_debate_template, tmp_path):
+    """Copy of the base moderator with its own initialized debate directory."""
+    # File manager and loggers hold locks and paths, so rebuild them instead
+    rebuilt = {"file_manager", "logger", "raw_data_logger"}
+    snapshot = {k: v for k, v in base_moderator.__dict__.items() if k not in rebuilt}
+    
+    moderator = DebateModerator.__new__(DebateModerator)
+    moderator.__dict__.update(copy.deepcopy(snapshot))
+    moderator.debate_dir = tmp_path / moderator.debate_id
+    shutil.copytree(initialized_debate_template, moderator.debate_dir, dirs_exist_ok=True)
+    moderator.file_manager = FileManager(str(moderator.debate_dir))
+    moderator.logger = DebateLogger(moderator.debate_id, moderator.debate_dir)
+    moderator.raw_data_logger = RawDataLogger(moderator.debate_id, str(moderator.debate_dir))
+    return moderator
+
+
+def _prep(moderator, tmp_path, topic="Test"):
+    """Point a freshly constructed moderator at tmp_path and initialize its files."""
+    moderator.debate_dir = tmp_path / moderator.debate_id
+    moderator.debate_dir.mkdir(parents=True, exist_ok=True)
+    # Rebuild everything holding the old path so all writes land in tmp_path
+    moderator.file_manager.close_all()
+    moderator.file_manager = FileManager(str(moderator.debate_dir))
+    moderator.logger = DebateLogger(moderator.debate_id, moderator.debate_dir)
+    moderator.raw_data_logger = RawDataLogger(moderator.debate_id, str(moderator.debate_dir))
+    moderator.file_manager.initialize_files(moderator.debate_id, topic)
+    return moderator
 
 
 # =============================================================================
@@ -110,13 +169,8 @@ def test_moderator_with_custom_debate_id(test_config):
 # =============================================================================
 
 @pytest.mark.asyncio
-async def test_execute_agent_turn_success(test_config, mock_agents, tmp_path, monkeypatch):
+async def test_execute_agent_turn_success(moderator, mock_agents):
     """Test successful agent turn execution."""
-    # Setup
-    moderator = DebateModerator(topic="Test", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test")
     moderator.agents = mock_agents
     
     # Execute turn
@@ -136,13 +190,8 @@ async def test_execute_agent_turn_success(test_config, mock_agents, tmp_path, mo
 
 
 @pytest.mark.asyncio
-async def test_execute_agent_turn_failure(test_config, mock_agents, tmp_path):
+async def test_execute_agent_turn_failure(moderator, mock_agents):
     """Test agent turn execution handles failures."""
-    # Setup
-    moderator = DebateModerator(topic="Test", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test")
     moderator.agents = mock_agents
     
     # Make agent fail
@@ -163,13 +212,8 @@ async def test_execute_agent_turn_failure(test_config, mock_agents, tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_execute_agent_turn_applies_file_updates(test_config, mock_agents, tmp_path):
+async def test_execute_agent_turn_applies_file_updates(moderator, mock_agents):
     """Test that file updates from agent are applied."""
-    # Setup
-    moderator = DebateModerator(topic="Test", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test")
     moderator.agents = mock_agents
     
     # Make agent return file update
@@ -209,126 +253,17 @@ async def test_execute_agent_turn_applies_file_updates(test_config, mock_agents,
 # FILE UPDATE APPLICATION TESTS
 # =============================================================================
 
-def test_apply_append_turn(test_config, tmp_path):
-    """Test APPEND_TURN file update."""
-    moderator = DebateModerator(topic="Test", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test")
-    
-    update = FileUpdate(
-        file_type="history_chat",
-        operation=FileUpdateOperation.APPEND_TURN,
-        data={
-            "speaker": "debator_a",
-            "round": 1,
-            "main_statement": "Test",
-            "supplementary_material": "",
-            "phase": "opening"
-        }
-    )
-    
-    moderator._apply_file_update(update)
-    
-    history = moderator.file_manager.read_for_agent("moderator", "history_chat")
-    # Check team_notes since this is written as a turn
-    assert "team_notes" in history
-
-
-def test_apply_add_citation(test_config, tmp_path):
-    """Test ADD_CITATION file update."""
-    moderator = DebateModerator(topic="Test", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test")
-    
-    update = FileUpdate(
-        file_type="citation_pool",
-        operation=FileUpdateOperation.ADD_CITATION,
-        data={
-            "team": "a",
-            "key": "cite1",
-            "citation": {
-                "source": "Test",
-                "content": "Test content",
-                "url": "http://test.com"
-            }
-        }
-    )
-    
-    moderator._apply_file_update(update)
-    
-    citations = moderator.file_manager.read_for_agent("moderator", "citation_pool")
-    assert "citations" in citations
-    assert "team a" in citations["citations"]
-    assert "cite1" in citations["citations"]["team a"]
-
-
-def test_apply_update_verification(test_config, tmp_path):
-    """Test UPDATE_VERIFICATION file update."""
-    moderator = DebateModerator(topic="Test", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test")
-    
-    # First add citation
-    moderator.file_manager.add_citation("a", "cite1", {
+def _seed_citation(file_manager):
+    """Add the citation that UPDATE_VERIFICATION modifies."""
+    file_manager.add_citation("a", "cite1", {
         "source": "Test",
         "content": "Test"
     })
-    
-    # Then update verification
-    update = FileUpdate(
-        file_type="citation_pool",
-        operation=FileUpdateOperation.UPDATE_VERIFICATION,
-        data={
-            "team": "a",
-            "key": "cite1",
-            "verification": {
-                "status": "verified",
-                "score": 0.9
-            }
-        }
-    )
-    
-    moderator._apply_file_update(update)
-    
-    citations = moderator.file_manager.read_for_agent("moderator", "citation_pool")
-    assert citations["citations"]["team a"]["cite1"]["verification"]["status"] == "verified"
-
-
-def test_apply_update_debate_latent(test_config, tmp_path):
-    """Test UPDATE_DEBATE_LATENT file update."""
-    moderator = DebateModerator(topic="Test", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test")
-    
-    update = FileUpdate(
-        file_type="debate_latent",
-        operation=FileUpdateOperation.UPDATE_DEBATE_LATENT,
-        data={
-            "round": 1,
-            "consensus_points": ["Point 1"],
-            "frontier": ["Issue 1"]
-        }
-    )
-    
-    moderator._apply_file_update(update)
-    
-    latent = moderator.file_manager.read_for_agent("moderator", "debate_latent")
-    assert len(latent["round_history"]) == 1
 
 
-def test_apply_add_crowd_vote(test_config, tmp_path):
-    """Test ADD_CROWD_VOTE file update."""
-    moderator = DebateModerator(topic="Test", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test")
-    
-    # First initialize voters
-    crowd_data = moderator.file_manager.read_for_agent("moderator", "crowd_opinion")
+def _seed_voter(file_manager):
+    """Add the voter that ADD_CROWD_VOTE updates."""
+    crowd_data = file_manager.read_for_agent("moderator", "crowd_opinion")
     crowd_data["voters"] = [
         {
             "voter_id": 1,
@@ -337,48 +272,129 @@ def test_apply_add_crowd_vote(test_config, tmp_path):
             "current_score": 50
         }
     ]
-    moderator.file_manager.write_by_moderator("crowd_opinion", crowd_data)
-    
-    # Add vote
-    update = FileUpdate(
-        file_type="crowd_opinion",
-        operation=FileUpdateOperation.ADD_CROWD_VOTE,
-        data={
-            "round": 1,
-            "votes": [
-                {"voter_id": 1, "score": 60, "rationale": "Test"}
-            ],
-            "average_score": 60,
-            "vote_count": 1,
-            "timestamp": "2026-01-06T10:00:00Z"
-        }
-    )
+    file_manager.write_by_moderator("crowd_opinion", crowd_data)
+
+
+# (setup_fn, update, check) - check receives the re-read target file
+APPLY_FILE_UPDATE_CASES = {
+    "append_turn": (
+        None,
+        FileUpdate(
+            file_type="history_chat",
+            operation=FileUpdateOperation.APPEND_TURN,
+            data={
+                "speaker": "debator_a",
+                "round": 1,
+                "main_statement": "Test",
+                "supplementary_material": "",
+                "phase": "opening"
+            }
+        ),
+        # Check team_notes since this is written as a turn
+        lambda history: "team_notes" in history
+    ),
+    "add_citation": (
+        None,
+        FileUpdate(
+            file_type="citation_pool",
+            operation=FileUpdateOperation.ADD_CITATION,
+            data={
+                "team": "a",
+                "key": "cite1",
+                "citation": {
+                    "source": "Test",
+                    "content": "Test content",
+                    "url": "http://test.com"
+                }
+            }
+        ),
+        lambda citations: "cite1" in citations["citations"]["team a"]
+    ),
+    "update_verification": (
+        _seed_citation,
+        FileUpdate(
+            file_type="citation_pool",
+            operation=FileUpdateOperation.UPDATE_VERIFICATION,
+            data={
+                "team": "a",
+                "key": "cite1",
+                "verification": {
+                    "status": "verified",
+                    "score": 0.9
+                }
+            }
+        ),
+        lambda citations: citations["citations"]["team a"]["cite1"]["verification"]["status"] == "verified"
+    ),
+    "update_debate_latent": (
+        None,
+        FileUpdate(
+            file_type="debate_latent",
+            operation=FileUpdateOperation.UPDATE_DEBATE_LATENT,
+            data={
+                "round": 1,
+                "consensus_points": ["Point 1"],
+                "frontier": ["Issue 1"]
+            }
+        ),
+        lambda latent: len(latent["round_history"]) == 1
+    ),
+    "add_crowd_vote": (
+        _seed_voter,
+        FileUpdate(
+            file_type="crowd_opinion",
+            operation=FileUpdateOperation.ADD_CROWD_VOTE,
+            data={
+                "round": 1,
+                "votes": [
+                    {"voter_id": 1, "score": 60, "rationale": "Test"}
+                ],
+                "average_score": 60,
+                "vote_count": 1,
+                "timestamp": "2026-01-06T10:00:00Z"
+            }
+        ),
+        lambda crowd: len(crowd["vote_rounds"]) == 1 and crowd["voters"][0]["current_score"] == 60
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "setup_fn,update,check",
+    list(APPLY_FILE_UPDATE_CASES.values()),
+    ids=list(APPLY_FILE_UPDATE_CASES)
+)
+def test_apply_file_update(moderator, setup_fn, update, check):
+    """Test each FileUpdateOperation is applied to its target file."""
+    if setup_fn:
+        setup_fn(moderator.file_manager)
     
     moderator._apply_file_update(update)
     
-    crowd = moderator.file_manager.read_for_agent("moderator", "crowd_opinion")
-    assert len(crowd["vote_rounds"]) == 1
-    assert crowd["voters"][0]["current_score"] == 60
+    data = moderator.file_manager.read_for_agent("moderator", update.file_type)
+    assert check(data)
 
 
 # =============================================================================
 # CHECKPOINT TESTS
 # =============================================================================
 
-def test_save_checkpoint(test_config, tmp_path):
+@pytest.mark.asyncio
+async def test_save_checkpoint(test_config, tmp_path):
     """Test checkpoint saving."""
     moderator = DebateModerator(topic="Test topic", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
+    _prep(moderator, tmp_path)
     moderator.state.assign_teams("for", "against", {"for": 60, "against": 40})
     moderator.state.round_number = 1
     moderator.state.turn_count = 5
     moderator.total_cost = 0.25
     
     moderator._save_checkpoint()
+    await moderator.aclose()
     
     checkpoint_path = moderator.debate_dir / "moderator_checkpoint.json"
     assert checkpoint_path.exists()
+    assert not checkpoint_path.with_suffix(".tmp").exists()
     
     with open(checkpoint_path) as f:
         checkpoint = json.load(f)
@@ -391,29 +407,215 @@ def test_save_checkpoint(test_config, tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_resume_from_checkpoint(test_config, tmp_path, monkeypatch):
-    """Test resuming debate from checkpoint."""
-    # Create initial moderator and save checkpoint
-    debate_id = "test-debate-123"
+async def test_save_checkpoint_appends_turn_log(test_config, tmp_path):
+    """Test that each save appends only the turns completed since the last one."""
+    moderator = DebateModerator(topic="Test topic", config=test_config)
+    _prep(moderator, tmp_path)
+    moderator.state.assign_teams("for", "against", {"for": 60, "against": 40})
+    
+    moderator.completed_turns.append({"turn": 1, "agent": "crowd", "cost": 0.02})
+    moderator._save_checkpoint()
+    moderator.completed_turns.append({"turn": 2, "agent": "debator_a", "cost": 0.08})
+    moderator._save_checkpoint()
+    await moderator.aclose()
     
-    # Mock the debates directory to use tmp_path
-    debates_dir = tmp_path / "debates"
-    debates_dir.mkdir()
+    lines = (moderator.debate_dir / "completed_turns.ndjson").read_text().splitlines()
+    assert [json.loads(line)["turn"] for line in lines] == [1, 2]
     
-    # Patch Path to use tmp_path for debates
-    import src.moderator
-    original_path = src.moderator.Path
+    with open(moderator.debate_dir / "moderator_checkpoint.json") as f:
+        checkpoint = json.load(f)
+    assert checkpoint["turn_log_count"] == 2
+    assert "completed_turns" not in checkpoint
+
+
+@pytest.mark.asyncio
+async def test_save_checkpoint_writes_in_background(test_config, tmp_path):
+    """Test that saves inside the event loop are deferred and coalesced."""
+    moderator = DebateModerator(topic="Test topic", config=test_config)
+    _prep(moderator, tmp_path)
+    moderator.state.assign_teams("for", "against", {"for": 60, "against": 40})
     
-    def mock_path(path_str):
-        if path_str.startswith("debates/"):
-            return tmp_path / path_str
-        return original_path(path_str)
+    moderator._save_checkpoint()
+    moderator.state.turn_count = 6
+    moderator._save_checkpoint()
+    
+    # Nothing is written until the loop gets control
+    checkpoint_path = moderator.debate_dir / "moderator_checkpoint.json"
+    assert not checkpoint_path.exists()
     
-    monkeypatch.setattr(src.moderator, "Path", mock_path)
+    await moderator.aclose()
     
-    moderator1 = DebateModerator(topic="Test topic", config=test_config, debate_id=debate_id)
-    moderator1.debate_dir = tmp_path / "debates" / debate_id
-    moderator1.debate_dir.mkdir(parents=True, exist_ok=True)
+    with open(checkpoint_path) as f:
+        checkpoint = json.load(f)
+    assert checkpoint["state"]["turn_count"] == 6
+
+
+@pytest.mark.asyncio
+async def test_save_checkpoint_snapshot_is_isolated(test_config, tmp_path):
+    """Test that changes made before a deferred write don't leak into it."""
+    moderator = DebateModerator(topic="Test topic", config=test_config)
+    _prep(moderator, tmp_path)
+    moderator.state.assign_teams("for", "against", {"for": 60, "against": 40})
+    moderator.state.turn_count = 1
+    moderator.completed_turns.append({"turn": 1, "agent": "crowd", "cost": 0.02})
+    
+    moderator._save_checkpoint()
+    moderator.state.turn_count = 2
+    moderator.completed_turns.append({"turn": 2, "agent": "debator_a", "cost": 0.08})
+    await moderator.aclose()
+    
+    with open(moderator.debate_dir / "moderator_checkpoint.json") as f:
+        checkpoint = json.load(f)
+    assert checkpoint["state"]["turn_count"] == 1
+    assert checkpoint["turn_log_count"] == 1
+    assert len((moderator.debate_dir / "completed_turns.ndjson").read_text().splitlines()) == 1
+
+
+@pytest.mark.asyncio
+async def test_save_checkpoint_recovers_from_failed_write(test_config, tmp_path, monkeypatch):
+    """Test that a failed background write is raised once and then retried."""
+    moderator = DebateModerator(topic="Test topic", config=test_config)
+    _prep(moderator, tmp_path)
+    moderator.state.assign_teams("for", "against", {"for": 60, "against": 40})
+
+    write_checkpoint = moderator._write_checkpoint
+    written = []
+
+    def flaky_write(checkpoint, turns):
+        written.append(checkpoint["state"]["turn_count"])
+        if len(written) == 1:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        write_checkpoint(checkpoint, turns)
+
+    monkeypatch.setattr(moderator, "_write_checkpoint", flaky_write)
+
+    moderator.state.turn_count = 1
+    moderator._save_checkpoint()
+    await asyncio.wait([moderator._checkpoint_task])
+
+    # The next save reports the failure, the one after starts a new writer
+    moderator.state.turn_count = 2
+    with pytest.raises(OSError):
+        moderator._save_checkpoint()
+    moderator._save_checkpoint()
+    assert not moderator._checkpoint_task.done()
+    await moderator.aclose()
+
+    assert written == [1, 2]
+    with open(moderator.debate_dir / "moderator_checkpoint.json") as f:
+        assert json.load(f)["state"]["turn_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_save_checkpoint_retries_state_of_failed_write(test_config, tmp_path, monkeypatch):
+    """Test that a state whose write failed isn't skipped as unchanged."""
+    moderator = DebateModerator(topic="Test topic", config=test_config)
+    _prep(moderator, tmp_path)
+    moderator.state.assign_teams("for", "against", {"for": 60, "against": 40})
+
+    write_checkpoint = moderator._write_checkpoint
+    written = []
+
+    def flaky_write(checkpoint, turns):
+        written.append(checkpoint["state"]["turn_count"])
+        if len(written) == 1:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        write_checkpoint(checkpoint, turns)
+
+    monkeypatch.setattr(moderator, "_write_checkpoint", flaky_write)
+
+    moderator.state.turn_count = 1
+    moderator._save_checkpoint()
+    with pytest.raises(OSError):
+        await moderator._flush_checkpoint()
+    assert moderator._checkpoint_task is None
+
+    moderator._save_checkpoint()
+    await moderator.aclose()
+
+    assert written == [1, 1]
+    with open(moderator.debate_dir / "moderator_checkpoint.json") as f:
+        assert json.load(f)["state"]["turn_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_save_during_flush_joins_running_writer(test_config, tmp_path, monkeypatch):
+    """Test that a save made while flushing never starts a second writer."""
+    moderator = DebateModerator(topic="Test topic", config=test_config)
+    _prep(moderator, tmp_path)
+    moderator.state.assign_teams("for", "against", {"for": 60, "against": 40})
+
+    write_checkpoint = moderator._write_checkpoint
+    release = threading.Event()
+    started = threading.Event()
+    active = []
+    overlapped = []
+
+    def gated_write(checkpoint, turns):
+        overlapped.append(bool(active))
+        active.append(checkpoint)
+        started.set()
+        release.wait(5)
+        write_checkpoint(checkpoint, turns)
+        active.remove(checkpoint)
+
+    monkeypatch.setattr(moderator, "_write_checkpoint", gated_write)
+
+    moderator.state.turn_count = 1
+    moderator._save_checkpoint()
+    writer = moderator._checkpoint_task
+    flush = asyncio.create_task(moderator._flush_checkpoint())
+    await asyncio.to_thread(started.wait, 5)
+
+    moderator.state.turn_count = 2
+    moderator._save_checkpoint()
+    assert moderator._checkpoint_task is writer
+
+    release.set()
+    await flush
+
+    assert moderator._checkpoint_task is None
+    assert overlapped == [False, False]
+    with open(moderator.debate_dir / "moderator_checkpoint.json") as f:
+        assert json.load(f)["state"]["turn_count"] == 2
+    await moderator.aclose()
+
+
+def test_save_checkpoint_skips_unchanged_state(test_config, tmp_path):
+    """Test that a save with nothing new since the last one is skipped."""
+    moderator = DebateModerator(topic="Test topic", config=test_config)
+    _prep(moderator, tmp_path)
+    moderator.state.assign_teams("for", "against", {"for": 60, "against": 40})
+    checkpoint_path = moderator.debate_dir / "moderator_checkpoint.json"
+    
+    # No running event loop here, so saves are written synchronously
+    moderator._save_checkpoint()
+    moderator._close_files()
+    checkpoint_path.unlink()
+    
+    moderator._save_checkpoint()
+    assert not checkpoint_path.exists()
+    
+    moderator.state.turn_count = 1
+    moderator._save_checkpoint()
+    moderator._close_files()
+    assert checkpoint_path.exists()
+    
+    checkpoint_path.unlink()
+    moderator.total_cost = 0.05
+    moderator._save_checkpoint()
+    moderator._close_files()
+    assert checkpoint_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_resume_from_checkpoint(test_config, tmp_path):
+    """Test resuming debate from checkpoint."""
+    # Create initial moderator and save checkpoint
+    debate_id = "test-debate-123"
+    config = dataclasses.replace(test_config, debates_root=tmp_path / "debates")
+    
+    moderator1 = DebateModerator(topic="Test topic", config=config, debate_id=debate_id)
     moderator1.file_manager.initialize_files(debate_id, "Test topic")
     moderator1.state.assign_teams("for", "against", {"for": 60, "against": 40})
     moderator1.state.round_number = 2
@@ -424,9 +626,10 @@ async def test_resume_from_checkpoint(test_config, tmp_path, monkeypatch):
         {"turn": 2, "agent": "factchecker_b", "cost": 0.15}
     ]
     moderator1._save_checkpoint()
+    await moderator1.aclose()
     
     # Resume from checkpoint
-    moderator2 = await DebateModerator.resume_from_checkpoint(debate_id, test_config)
+    moderator2 = await DebateModerator.resume_from_checkpoint(debate_id, config)
     
     # Verify state matches
     assert moderator2.debate_id == debate_id
@@ -492,20 +695,23 @@ def test_calculate_cost_by_agent(test_config):
     assert costs["debator_a"] == 0.16
     assert costs["factchecker_b"] == 0.15
     assert costs["judge"] == 0.25
+    
+    # Later calls only add the newly completed turns
+    moderator.completed_turns.append({"turn": 5, "agent": "judge", "cost": 0.25})
+    assert moderator._calculate_cost_by_agent()["judge"] == 0.5
 
 
 # =============================================================================
 # AGENT INITIALIZATION TESTS
 # =============================================================================
 
-def test_initialize_agents(test_config, tmp_path):
+@pytest.mark.asyncio
+async def test_initialize_agents(test_config, tmp_path):
     """Test agent initialization with correct stances."""
     moderator = DebateModerator(topic="Test", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test")
+    _prep(moderator, tmp_path)
     
-    agents = moderator._initialize_agents(team_a_stance="for", team_b_stance="against")
+    agents = await moderator._initialize_agents(team_a_stance="for", team_b_stance="against")
     
     assert len(agents) == 6
     assert "debator_a" in agents
@@ -528,9 +734,7 @@ def test_initialize_agents(test_config, tmp_path):
 async def test_generate_transcript(test_config, tmp_path):
     """Test transcript generation."""
     moderator = DebateModerator(topic="Test topic", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test topic")
+    _prep(moderator, tmp_path, topic="Test topic")
     
     # Add some turns - use "statement" not "main_statement" to go to public_transcript
     moderator.file_manager.append_turn("debator_a", {
@@ -565,9 +769,7 @@ async def test_generate_transcript(test_config, tmp_path):
 async def test_generate_citation_ledger(test_config, tmp_path):
     """Test citation ledger generation."""
     moderator = DebateModerator(topic="Test", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test")
+    _prep(moderator, tmp_path)
     
     output_dir = moderator.debate_dir / "outputs"
     output_dir.mkdir()
@@ -583,9 +785,7 @@ async def test_generate_citation_ledger(test_config, tmp_path):
 async def test_generate_sentiment_graph(test_config, tmp_path):
     """Test sentiment graph CSV generation."""
     moderator = DebateModerator(topic="Test", config=test_config)
-    moderator.debate_dir = tmp_path / moderator.debate_id
-    moderator.debate_dir.mkdir(parents=True)
-    moderator.file_manager.initialize_files(moderator.debate_id, "Test")
+    _prep(moderator, tmp_path)
     
     # Add voter data
     crowd_data = moderator.file_manager.read_for_agent("moderator", "crowd_opinion")
@@ -230,6 +230,30 @@ class TestSerialization:
         assert data["resource_multiplier"] == 1.25
         assert data["audience_bias"] == 0.7
     
+    def test_to_dict_tracks_mutations(self):
+        """Test that the cached dict is refreshed after state changes."""
+        state = DebateState("test_id", "test topic")
+        first = state.to_dict()
+        first["turn_count"] = 99  # Callers get a copy, not the cache
+        
+        assert state.to_dict()["turn_count"] == 0
+        
+        state.next_turn("debator_a")
+        state.transition_to(DebatePhase.OPENING)
+        data = state.to_dict()
+        
+        assert data["turn_count"] == 1
+        assert data["current_speaker"] == "debator_a"
+        assert data["phase"] == "opening"
+    
+    def test_state_has_no_instance_dict(self):
+        """Test that state uses slots, so unknown attributes are rejected."""
+        state = DebateState("test_id", "test topic")
+        
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.round = 1  # typo for round_number
+    
     def test_from_dict(self):
         """Test creating state from dictionary."""
         data = {
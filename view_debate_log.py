@@ -9,11 +9,28 @@ Usage:
     python view_debate_log.py <debate_id> --raw
 """
 
+import argparse
 import json
+import os
+import re
 import sys
+from collections import Counter
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, Iterator, Dict, Any, Optional
 from datetime import datetime
+from functools import lru_cache
+
+from src.utils.log_reader import buffered_stdout, iter_jsonl
+
+
+# Banner rule and entry header, built once rather than per printed entry
+_RULE = "=" * 80
+_ENTRY_HEADER = "\n" + _RULE + "\n[{}] {}\n" + _RULE
+
+# DebateLogger writes "type" as each entry's first key, so the first match
+# in a raw line is that entry's type
+_TYPE_RE = re.compile(rb'"type": "([^"\\]*)"')
 
 
 def find_most_recent_debate() -> Optional[str]:
@@ -23,164 +40,241 @@ def find_most_recent_debate() -> Optional[str]:
     Returns:
         Most recent debate ID, or None if no debates found
     """
-    debates_dir = Path("debates")
-    
-    if not debates_dir.exists():
-        return None
-    
     most_recent_id = None
     most_recent_time = 0
     
-    # Check each debate directory
-    for debate_dir in debates_dir.iterdir():
-        if not debate_dir.is_dir():
-            continue
-        
-        debate_id = debate_dir.name
-        
-        # Check for log file (most reliable indicator of recent activity)
-        log_file = debate_dir / "debate_log.jsonl"
-        if log_file.exists():
-            mtime = log_file.stat().st_mtime
-            if mtime > most_recent_time:
-                most_recent_time = mtime
-                most_recent_id = debate_id
-        else:
-            # Fallback: check checkpoint file
-            checkpoint_file = debate_dir / "moderator_checkpoint.json"
-            if checkpoint_file.exists():
-                mtime = checkpoint_file.stat().st_mtime
+    # Check each debate directory (scandir entries cache the file type)
+    try:
+        it = os.scandir("debates")
+    except FileNotFoundError:
+        return None
+    with it:
+        for debate_dir in it:
+            if not debate_dir.is_dir():
+                continue
+            
+            # Log file is the most reliable indicator of recent activity;
+            # fall back to the checkpoint file
+            for filename in ("debate_log.jsonl", "moderator_checkpoint.json"):
+                try:
+                    mtime = os.stat(os.path.join(debate_dir.path, filename)).st_mtime
+                except FileNotFoundError:
+                    continue
                 if mtime > most_recent_time:
                     most_recent_time = mtime
-                    most_recent_id = debate_id
+                    most_recent_id = debate_dir.name
+                break
     
     return most_recent_id
 
 
-def load_logs(debate_id: str) -> List[Dict[str, Any]]:
-    """Load all log entries from debate log file."""
+def load_logs(
+    debate_id: str,
+    keep: Optional[Callable[[bytes], bool]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream log entries from debate log file (one parsed entry at a time).
+    
+    Args:
+        debate_id: Debate identifier
+        keep: Optional raw-bytes pre-filter; lines it rejects aren't parsed
+    """
     log_file = Path(f"debates/{debate_id}/debate_log.jsonl")
     
-    if not log_file.exists():
+    # The log is opened on the first read; a missing one is reported then
+    try:
+        yield from iter_jsonl(log_file, keep)
+    except FileNotFoundError:
         print(f"❌ Log file not found: {log_file}")
         print(f"\nMake sure:")
         print(f"  1. Debate ID is correct: {debate_id}")
         print(f"  2. Debate has been run (logs are created during execution)")
         sys.exit(1)
-    
-    entries = []
-    with open(log_file, "r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-    
-    return entries
 
 
 def format_timestamp(iso_string: str) -> str:
     """Format ISO timestamp to readable format."""
     try:
+        # Log timestamps carry microseconds, so cache on the whole second;
+        # the fraction and a trailing "Z" don't change the output
+        fraction = iso_string[19:].rstrip("Z")
+        if len(iso_string) >= 19 and (not fraction or (fraction[0] == "." and fraction[1:].isdigit())):
+            return _format_second(iso_string[:19])
         dt = datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
         return dt.strftime("%Y-%m-%d %H:%M:%S")
     except:
         return iso_string
 
 
+@lru_cache(maxsize=4096)
+def _format_second(iso_second: str) -> str:
+    """Format a "YYYY-MM-DDTHH:MM:SS" prefix (raises ValueError if invalid)."""
+    return datetime.strptime(iso_second, "%Y-%m-%dT%H:%M:%S").strftime("%Y-%m-%d %H:%M:%S")
+
+
 def print_entry(entry: Dict[str, Any], show_raw: bool = False):
     """Print a single log entry in readable format."""
+    sys.stdout.write(format_entry(entry, show_raw))
+
+
+def format_entry(entry: Dict[str, Any], show_raw: bool = False) -> str:
+    """Render a single log entry as the text print_entry writes."""
     entry_type = entry.get("type", "unknown")
     timestamp = format_timestamp(entry.get("timestamp", ""))
     
-    print(f"\n{'='*80}")
-    print(f"[{timestamp}] {entry_type.upper()}")
-    print(f"{'='*80}")
+    # Collect the entry's lines and join them once
+    lines = []
+    add = lines.append
     
-    if entry_type == "agent_turn":
-        agent = entry.get("agent", {})
-        print(f"Agent: {agent.get('name', 'unknown')} ({agent.get('role', 'unknown')})")
-        print(f"Phase: {entry.get('phase', 'unknown')} | Round: {entry.get('round_number', 'unknown')}")
-        
-        response = entry.get("response", {})
-        print(f"\nResponse:")
-        print(f"  Success: {response.get('success', False)}")
-        print(f"  Output keys: {', '.join(response.get('output_keys', []))}")
-        
-        if response.get("output_preview"):
-            print(f"\n  Output preview:")
-            print(f"  {response['output_preview'][:500]}")
-        
-        if entry.get("raw_llm_output"):
-            if show_raw:
-                print(f"\n  Raw LLM Output:")
-                print(f"  {entry['raw_llm_output']}")
-            else:
-                print(f"\n  Raw LLM Output: {len(entry['raw_llm_output'])} chars (use --raw to see)")
-        
-        if entry.get("errors"):
-            print(f"\n  Errors:")
-            for error in entry["errors"]:
-                print(f"    - {error}")
-        
-        file_updates = response.get("file_updates_count", 0)
-        if file_updates > 0:
-            print(f"\n  File updates: {file_updates}")
+    add(_ENTRY_HEADER.format(timestamp, _type_label(entry_type)))
+    
+    _PRINTERS.get(entry_type, _format_default)(entry, show_raw, add)
     
-    elif entry_type == "moderator_action":
-        print(f"Action: {entry.get('action', 'unknown')}")
-        details = entry.get("details", {})
-        if details:
-            print(f"\nDetails:")
-            for key, value in details.items():
-                print(f"  {key}: {value}")
+    return "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=None)
+def _type_label(entry_type: str) -> str:
+    """Header label for an entry type (there are only a handful of types)."""
+    return entry_type.upper()
+
+
+def _format_agent_turn(entry: Dict[str, Any], show_raw: bool, add: Callable[[str], None]):
+    """Agent turn: speaker, response summary, raw output and errors."""
+    get = entry.get
+    agent = get("agent", {})
+    add(f"Agent: {agent.get('name', 'unknown')} ({agent.get('role', 'unknown')})")
+    add(f"Phase: {get('phase', 'unknown')} | Round: {get('round_number', 'unknown')}")
     
-    elif entry_type == "file_update":
-        print(f"File: {entry.get('file_type', 'unknown')}")
-        print(f"Operation: {entry.get('operation', 'unknown')}")
-        data = entry.get("data_preview", {})
-        if data:
-            print(f"\nData preview:")
-            print(f"  {json.dumps(data, indent=2)[:500]}")
+    response = get("response", {})
+    add(f"\nResponse:")
+    add(f"  Success: {response.get('success', False)}")
+    add(f"  Output keys: {', '.join(response.get('output_keys', []))}")
     
-    elif entry_type == "llm_request":
-        print(f"Agent: {entry.get('agent', 'unknown')}")
-        print(f"Model: {entry.get('model', 'unknown')}")
-        print(f"Prompt length: {entry.get('prompt_length', 0)} chars")
-        if show_raw:
-            print(f"\nPrompt preview:")
-            print(f"  {entry.get('prompt_preview', '')}")
-        else:
-            print(f"  Prompt: {entry.get('prompt_preview', '')[:200]}...")
+    output_preview = response.get("output_preview")
+    if output_preview:
+        add(f"\n  Output preview:")
+        add(f"  {output_preview[:500]}")
     
-    elif entry_type == "llm_response":
-        print(f"Agent: {entry.get('agent', 'unknown')}")
-        print(f"Model: {entry.get('model', 'unknown')}")
-        print(f"Response length: {entry.get('response_length', 0)} chars")
-        if entry.get("tokens_used"):
-            print(f"Tokens used: {entry.get('tokens_used')}")
-        if entry.get("cost"):
-            print(f"Cost: ${entry.get('cost'):.4f}")
+    raw_output = get("raw_llm_output")
+    if raw_output:
         if show_raw:
-            print(f"\nResponse:")
-            print(f"  {entry.get('response_preview', '')}")
+            add(f"\n  Raw LLM Output:")
+            add(f"  {raw_output}")
         else:
-            print(f"  Response preview: {entry.get('response_preview', '')[:200]}...")
+            add(f"\n  Raw LLM Output: {len(raw_output)} chars (use --raw to see)")
     
-    elif entry_type == "error":
-        print(f"Error Type: {entry.get('error_type', 'unknown')}")
-        print(f"Message: {entry.get('message', 'unknown')}")
-        if entry.get("traceback") and show_raw:
-            print(f"\nTraceback:")
-            print(f"  {entry['traceback']}")
-    
-    elif entry_type == "system":
-        print(f"Event: {entry.get('event', 'unknown')}")
+    errors = get("errors")
+    if errors:
+        add(f"\n  Errors:")
+        for error in errors:
+            add(f"    - {error}")
     
+    file_updates = response.get("file_updates_count", 0)
+    if file_updates > 0:
+        add(f"\n  File updates: {file_updates}")
+
+
+def _format_moderator_action(entry: Dict[str, Any], show_raw: bool, add: Callable[[str], None]):
+    """Moderator action and its details."""
+    add(f"Action: {entry.get('action', 'unknown')}")
+    details = entry.get("details", {})
+    if details:
+        add(f"\nDetails:")
+        for key, value in details.items():
+            add(f"  {key}: {value}")
+
+
+def _format_file_update(entry: Dict[str, Any], show_raw: bool, add: Callable[[str], None]):
+    """File update operation with a data preview."""
+    add(f"File: {entry.get('file_type', 'unknown')}")
+    add(f"Operation: {entry.get('operation', 'unknown')}")
+    data = entry.get("data_preview", {})
+    if data:
+        add(f"\nData preview:")
+        add(f"  {_json_preview(data, 500)}")
+
+
+def _json_preview(data: Any, limit: int) -> str:
+    """
+    Return json.dumps(data, indent=2)[:limit], serializing only as much of
+    data as the preview needs.
+    """
+    chunks = []
+    size = 0
+    for chunk in json.JSONEncoder(indent=2).iterencode(data):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(chunks)[:limit]
+
+
+def _format_llm_request(entry: Dict[str, Any], show_raw: bool, add: Callable[[str], None]):
+    """LLM request with a prompt preview."""
+    get = entry.get
+    add(f"Agent: {get('agent', 'unknown')}")
+    add(f"Model: {get('model', 'unknown')}")
+    add(f"Prompt length: {get('prompt_length', 0)} chars")
+    prompt_preview = get("prompt_preview", "")
+    if show_raw:
+        add(f"\nPrompt preview:")
+        add(f"  {prompt_preview}")
     else:
-        print(f"Raw entry:")
-        print(json.dumps(entry, indent=2))
+        add(f"  Prompt: {prompt_preview[:200]}...")
+
+
+def _format_llm_response(entry: Dict[str, Any], show_raw: bool, add: Callable[[str], None]):
+    """LLM response with usage and a response preview."""
+    get = entry.get
+    add(f"Agent: {get('agent', 'unknown')}")
+    add(f"Model: {get('model', 'unknown')}")
+    add(f"Response length: {get('response_length', 0)} chars")
+    tokens_used = get("tokens_used")
+    if tokens_used:
+        add(f"Tokens used: {tokens_used}")
+    cost = get("cost")
+    if cost:
+        add(f"Cost: ${cost:.4f}")
+    response_preview = get("response_preview", "")
+    if show_raw:
+        add(f"\nResponse:")
+        add(f"  {response_preview}")
+    else:
+        add(f"  Response preview: {response_preview[:200]}...")
+
+
+def _format_error(entry: Dict[str, Any], show_raw: bool, add: Callable[[str], None]):
+    """Logged error (traceback only with --raw)."""
+    add(f"Error Type: {entry.get('error_type', 'unknown')}")
+    add(f"Message: {entry.get('message', 'unknown')}")
+    traceback = entry.get("traceback")
+    if traceback and show_raw:
+        add(f"\nTraceback:")
+        add(f"  {traceback}")
+
+
+def _format_system(entry: Dict[str, Any], show_raw: bool, add: Callable[[str], None]):
+    """System event."""
+    add(f"Event: {entry.get('event', 'unknown')}")
+
+
+def _format_default(entry: Dict[str, Any], show_raw: bool, add: Callable[[str], None]):
+    """Unknown entry type: dump it as JSON."""
+    add(f"Raw entry:")
+    add(json.dumps(entry, indent=2))
+
+
+# Per-type formatters; each appends an entry's body lines via add()
+_PRINTERS = {
+    "agent_turn": _format_agent_turn,
+    "moderator_action": _format_moderator_action,
+    "file_update": _format_file_update,
+    "llm_request": _format_llm_request,
+    "llm_response": _format_llm_response,
+    "error": _format_error,
+    "system": _format_system,
+}
 
 
 def view_logs(
@@ -190,68 +284,114 @@ def view_logs(
     show_raw: bool = False
 ):
     """View debate logs with optional filtering."""
-    entries = load_logs(debate_id)
+    with buffered_stdout():
+        _view_logs(debate_id, filter_type, filter_agent, show_raw)
+
+
+def _view_logs(
+    debate_id: str,
+    filter_type: Optional[str],
+    filter_agent: Optional[str],
+    show_raw: bool
+):
+    """Print the filtered entries and summary (stdout is buffered by view_logs)."""
+    type_counts = Counter()
+    
+    # A filtered view only parses lines containing the filter value as a
+    # JSON string; rejected lines are tallied by their raw "type" so the
+    # summary still covers every entry
+    keep = None
+    filter_value = filter_type or filter_agent
+    if filter_value:
+        needle = json.dumps(filter_value, ensure_ascii=False).encode("utf-8")
+        
+        def keep(line: bytes) -> bool:
+            if needle in line:
+                return True
+            if line.rstrip().endswith(b"}"):  # partial lines aren't entries
+                match = _TYPE_RE.search(line)
+                type_counts[match.group(1).decode("utf-8") if match else "unknown"] += 1
+            return False
+    
+    entries = load_logs(debate_id, keep)
     
-    if not entries:
+    first = next(entries, None)
+    if first is None and not type_counts:
         print(f"❌ No log entries found for debate {debate_id}")
         return
+    if first is not None:
+        entries = chain((first,), entries)
     
-    print(f"\n{'='*80}")
+    print("\n" + _RULE)
     print(f"DEBATE LOG VIEWER")
-    print(f"{'='*80}")
+    print(_RULE)
     print(f"Debate ID: {debate_id}")
-    print(f"Total entries: {len(entries)}")
-    print(f"{'='*80}\n")
+    print(_RULE + "\n")
     
-    # Apply filters
-    filtered_entries = entries
     if filter_type:
-        filtered_entries = [e for e in filtered_entries if e.get("type") == filter_type]
-        print(f"Filtered by type: {filter_type} ({len(filtered_entries)} entries)\n")
-    
+        print(f"Filtered by type: {filter_type}\n")
     if filter_agent:
-        filtered_entries = [
-            e for e in filtered_entries
-            if e.get("agent", {}).get("name") == filter_agent or e.get("agent") == filter_agent
-        ]
-        print(f"Filtered by agent: {filter_agent} ({len(filtered_entries)} entries)\n")
+        print(f"Filtered by agent: {filter_agent}\n")
     
-    # Print entries
-    for entry in filtered_entries:
+    # Single pass: every entry is counted for the summary, matches are printed
+    shown = 0
+    for entry in entries:
+        type_counts[entry.get("type", "unknown")] += 1
+        
+        if filter_type and entry.get("type") != filter_type:
+            continue
+        if filter_agent and not _matches_agent(entry, filter_agent):
+            continue
+        
+        shown += 1
         print_entry(entry, show_raw=show_raw)
     
     # Summary
-    print(f"\n{'='*80}")
+    print("\n" + _RULE)
     print(f"SUMMARY")
-    print(f"{'='*80}")
-    
-    type_counts = {}
-    for entry in entries:
-        entry_type = entry.get("type", "unknown")
-        type_counts[entry_type] = type_counts.get(entry_type, 0) + 1
+    print(_RULE)
+    print(f"Total entries: {sum(type_counts.values())}")
+    if filter_type or filter_agent:
+        print(f"Matching entries: {shown}")
     
     for entry_type, count in sorted(type_counts.items()):
         print(f"  {entry_type}: {count}")
     
-    print(f"{'='*80}\n")
+    print(_RULE + "\n")
+
+
+def _matches_agent(entry: Dict[str, Any], agent_name: str) -> bool:
+    """Check an entry's agent; agent_turn entries nest it, LLM entries don't."""
+    agent = entry.get("agent")
+    if isinstance(agent, dict):
+        return agent.get("name") == agent_name
+    return agent == agent_name
 
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python view_debate_log.py <debate_id|last> [options]")
-        print("\nOptions:")
-        print("  --filter <type>     Filter by entry type (agent_turn, llm_request, etc.)")
-        print("  --agent <name>      Filter by agent name")
-        print("  --raw               Show full raw outputs")
-        print("\nExamples:")
-        print("  python view_debate_log.py abc-123")
-        print("  python view_debate_log.py last")
-        print("  python view_debate_log.py last --filter agent_turn")
-        print("  python view_debate_log.py abc-123 --agent debator_a --raw")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="View comprehensive debate logs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "examples:\n"
+            "  python view_debate_log.py abc-123\n"
+            "  python view_debate_log.py last\n"
+            "  python view_debate_log.py last --filter agent_turn\n"
+            "  python view_debate_log.py abc-123 --agent debator_a --raw"
+        )
+    )
+    parser.add_argument("debate_id", help="Debate ID to view (or 'last' for most recent)")
+    parser.add_argument("--filter", dest="filter_type", metavar="TYPE",
+                        help="Filter by entry type (agent_turn, llm_request, etc.)")
+    parser.add_argument("--agent", metavar="NAME", help="Filter by agent name")
+    parser.add_argument("--raw", action="store_true", help="Show full raw outputs")
+    
+    # Unknown options are an error rather than silently ignored, so a typo'd
+    # filter can't turn into an unfiltered dump of the whole log
+    args = parser.parse_args()
     
-    debate_id = sys.argv[1]
+    debate_id = args.debate_id
     
     # Handle "last" keyword to find most recent debate
     if debate_id.lower() == "last":
@@ -263,26 +403,7 @@ def main():
         debate_id = most_recent
         print(f"📋 Using most recent debate: {debate_id}\n")
     
-    # Parse options
-    filter_type = None
-    filter_agent = None
-    show_raw = False
-    
-    i = 2
-    while i < len(sys.argv):
-        if sys.argv[i] == "--filter" and i + 1 < len(sys.argv):
-            filter_type = sys.argv[i + 1]
-            i += 2
-        elif sys.argv[i] == "--agent" and i + 1 < len(sys.argv):
-            filter_agent = sys.argv[i + 1]
-            i += 2
-        elif sys.argv[i] == "--raw":
-            show_raw = True
-            i += 1
-        else:
-            i += 1
-    
-    view_logs(debate_id, filter_type, filter_agent, show_raw)
+    view_logs(debate_id, args.filter_type, args.agent, args.raw)
 
 
 if __name__ == "__main__":
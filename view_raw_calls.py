@@ -13,8 +13,20 @@ Usage:
 import argparse
 import json
 import os
+import sys
+from collections import Counter
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache, partial
+
+from src.utils.log_reader import PARALLEL_MIN_BYTES, buffered_stdout, iter_jsonl, map_jsonl
+
+
+# Banner rules and call header, built once rather than per printed call
+_RULE = "=" * 100
+_CALL_HEADER = "\n" + _RULE + "\nCALL #{}\n" + _RULE
+_DIVIDER = "-" * 100
 
 
 def find_most_recent_debate():
@@ -24,64 +36,142 @@ def find_most_recent_debate():
     Returns:
         str: Most recent debate ID, or None if no debates found
     """
-    debates_dir = Path("debates")
-    if not debates_dir.exists():
-        return None
-    
-    # Get all debate directories with raw_model_calls.jsonl
-    debate_dirs = [
-        d for d in debates_dir.iterdir() 
-        if d.is_dir() and (d / "raw_model_calls.jsonl").exists()
-    ]
+    most_recent_id = None
+    most_recent_time = 0
     
-    if not debate_dirs:
+    # One stat per debate directory; those without the log are skipped
+    try:
+        it = os.scandir("debates")
+    except FileNotFoundError:
         return None
+    with it:
+        for debate_dir in it:
+            if not debate_dir.is_dir():
+                continue
+            try:
+                mtime = os.stat(os.path.join(debate_dir.path, "raw_model_calls.jsonl")).st_mtime
+            except FileNotFoundError:
+                continue
+            if mtime > most_recent_time:
+                most_recent_time = mtime
+                most_recent_id = debate_dir.name
     
-    # Sort by modification time of raw_model_calls.jsonl
-    most_recent = max(
-        debate_dirs,
-        key=lambda d: (d / "raw_model_calls.jsonl").stat().st_mtime
-    )
+    return most_recent_id
+
+
+def load_calls(debate_id, keep=None):
+    """
+    Stream raw model calls from debate log file.
     
-    return most_recent.name
+    Args:
+        debate_id: Debate identifier
+        keep: Optional raw-bytes pre-filter; lines it rejects aren't parsed
+        
+    Yields:
+        dict: Call entries, parsed one at a time (none if no log file)
+    """
+    log_file = Path(f"debates/{debate_id}/raw_model_calls.jsonl")
+    
+    try:
+        yield from iter_jsonl(log_file, keep)
+    except FileNotFoundError:  # no calls logged for this debate
+        return
 
 
-def load_calls(debate_id):
+def iter_calls(debate_id, agent_filter=None, model_filter=None):
     """
-    Load raw model calls from debate log file.
+    Stream the raw model calls matching the filters in one pass over the log.
+    
+    Filters are case-insensitive substrings of the agent name and model.
+    Lines that can't contain the filter text aren't parsed at all, and a
+    filtered scan of a large log is split across processes.
     
     Args:
         debate_id: Debate identifier
+        agent_filter: Optional agent name to filter by
+        model_filter: Optional model name to filter by
         
-    Returns:
-        list: List of call entries
+    Yields:
+        dict: Matching call entries, in file order
     """
     log_file = Path(f"debates/{debate_id}/raw_model_calls.jsonl")
     
-    if not log_file.exists():
-        return []
+    if (agent_filter or model_filter) and (os.cpu_count() or 1) > 1:
+        try:
+            size = os.stat(log_file).st_size
+        except FileNotFoundError:
+            size = 0
+        if size >= PARALLEL_MIN_BYTES:
+            worker = partial(_match_calls, agent_filter, model_filter)
+            for calls in map_jsonl(log_file, worker):
+                yield from calls
+            return
     
-    entries = []
-    with open(log_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+    keep = _raw_filter(agent_filter or model_filter)
+    yield from _filter_calls(load_calls(debate_id, keep), agent_filter, model_filter)
+
+
+def _match_calls(agent_filter, model_filter, path, start, end):
+    """map_jsonl worker for iter_calls: the matching calls in one byte range."""
+    keep = _raw_filter(agent_filter or model_filter)
+    calls = iter_jsonl(path, keep, start, end)
+    return list(_filter_calls(calls, agent_filter, model_filter))
+
+
+def _filter_calls(calls, agent_filter, model_filter):
+    """Yield the parsed calls whose agent name and model match the filters."""
+    agent_text = agent_filter.lower() if agent_filter else None
+    model_text = model_filter.lower() if model_filter else None
+    for entry in calls:
+        # An exact name needs no lowercased copy of the entry's field
+        if agent_text:
+            agent = entry['agent_name']
+            if agent != agent_filter and agent_text not in agent.lower():
+                continue
+        if model_text:
+            model = entry['model']
+            if model != model_filter and model_text not in model.lower():
+                continue
+        yield entry
+
+
+def _raw_filter(filter_text):
+    """
+    Build an iter_jsonl pre-filter for lines that may contain filter_text.
+    
+    Only plain ASCII text is written to the log verbatim; text JSON may
+    escape (quotes, non-ASCII) isn't pre-filtered.
+    """
+    if not filter_text or not filter_text.isascii() or json.dumps(filter_text)[1:-1] != filter_text:
+        return None
+    needle = filter_text.lower().encode("ascii")
     
-    return entries
+    def keep(line):
+        return needle in line.lower()
+    
+    return keep
 
 
 def format_timestamp(iso_timestamp):
     """Format ISO timestamp for display."""
     try:
+        # Log timestamps carry microseconds, so cache on the whole second;
+        # the fraction and a trailing "Z" don't change the output
+        fraction = iso_timestamp[19:].rstrip("Z")
+        if len(iso_timestamp) >= 19 and (not fraction or (fraction[0] == "." and fraction[1:].isdigit())):
+            return _format_second(iso_timestamp[:19])
         dt = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
         return dt.strftime("%Y-%m-%d %H:%M:%S")
     except:
         return iso_timestamp
 
 
+@lru_cache(maxsize=4096)
+def _format_second(iso_second):
+    """Format a "YYYY-MM-DDTHH:MM:SS" prefix (raises ValueError if invalid)."""
+    return datetime.strptime(iso_second, "%Y-%m-%dT%H:%M:%S").strftime("%Y-%m-%d %H:%M:%S")
+
+
 def print_call(entry, index, show_full=True):
     """
     Print a single model call entry.
@@ -91,53 +181,86 @@ def print_call(entry, index, show_full=True):
         index: Entry number
         show_full: Whether to show full prompts/responses
     """
-    print(f"\n{'='*100}")
-    print(f"CALL #{index+1}")
-    print(f"{'='*100}")
+    sys.stdout.write(format_call(entry, index, show_full))
+
+
+def _clip(text, limit):
+    """Return text cut to limit characters, marked with "..." if cut."""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}..."
+
+
+def format_call(entry, index, show_full=True):
+    """
+    Render a single model call entry as the text print_call writes.
+    
+    Args:
+        entry: Call entry dictionary
+        index: Entry number
+        show_full: Whether to show full prompts/responses
+        
+    Returns:
+        str: Entry text, ending with a newline
+    """
+    # Collect the call's lines and join them once
+    lines = []
+    add = lines.append
+    
+    inp = entry['input']
+    output = entry['output']
+    parameters = entry['parameters']
+    
+    add(_CALL_HEADER.format(index + 1))
     
     # Basic info
-    print(f"Timestamp:  {format_timestamp(entry['timestamp'])}")
-    print(f"Agent:      {entry['agent_name']}")
-    print(f"Model:      {entry['model']}")
-    print(f"Parameters: temp={entry['parameters']['temperature']}, max_tokens={entry['parameters']['max_tokens']}")
+    add(f"Timestamp:  {format_timestamp(entry['timestamp'])}")
+    add(f"Agent:      {entry['agent_name']}")
+    add(f"Model:      {entry['model']}")
+    add(f"Parameters: temp={parameters['temperature']}, max_tokens={parameters['max_tokens']}")
     
     # Check if batch call
     if entry.get('call_type') == 'batch':
-        print(f"\nBATCH CALL: {entry['input']['batch_size']} prompts")
-        print(f"Average response length: {entry['output']['avg_length_chars']:.0f} chars")
+        add(f"\nBATCH CALL: {inp['batch_size']} prompts")
+        add(f"Average response length: {output['avg_length_chars']:.0f} chars")
         
         if show_full:
-            print(f"\n{'-'*100}")
-            print("PROMPTS:")
-            for i, prompt in enumerate(entry['input']['prompts'], 1):
-                print(f"\n[Prompt {i}]")
-                print(prompt[:500] + "..." if len(prompt) > 500 else prompt)
+            add("\n" + _DIVIDER)
+            add("PROMPTS:")
+            for i, prompt in enumerate(inp['prompts'], 1):
+                add(f"\n[Prompt {i}]")
+                add(_clip(prompt, 500))
             
-            print(f"\n{'-'*100}")
-            print("RESPONSES:")
-            for i, response in enumerate(entry['output']['responses'], 1):
-                print(f"\n[Response {i}]")
-                print(response[:500] + "..." if len(response) > 500 else response)
+            add("\n" + _DIVIDER)
+            add("RESPONSES:")
+            for i, response in enumerate(output['responses'], 1):
+                add(f"\n[Response {i}]")
+                add(_clip(response, 500))
     else:
         # Single call
-        print(f"Response:   {entry['output']['length_chars']} chars, {entry['output']['length_lines']} lines")
+        add(f"Response:   {output['length_chars']} chars, {output['length_lines']} lines")
         
         if show_full:
             # System prompt
-            if entry['input'].get('system_prompt'):
-                print(f"\n{'-'*100}")
-                print("SYSTEM PROMPT:")
-                print(entry['input']['system_prompt'][:1000] + "..." if len(entry['input']['system_prompt']) > 1000 else entry['input']['system_prompt'])
+            system_prompt = inp.get('system_prompt')
+            if system_prompt:
+                add("\n" + _DIVIDER)
+                add("SYSTEM PROMPT:")
+                add(_clip(system_prompt, 1000))
             
             # User prompt
-            print(f"\n{'-'*100}")
-            print("USER PROMPT:")
-            print(entry['input']['user_prompt'][:2000] + "..." if len(entry['input']['user_prompt']) > 2000 else entry['input']['user_prompt'])
+            user_prompt = inp['user_prompt']
+            add("\n" + _DIVIDER)
+            add("USER PROMPT:")
+            add(_clip(user_prompt, 2000))
             
             # Response
-            print(f"\n{'-'*100}")
-            print("RESPONSE:")
-            print(entry['output']['response'][:2000] + "..." if len(entry['output']['response']) > 2000 else entry['output']['response'])
+            response = output['response']
+            add("\n" + _DIVIDER)
+            add("RESPONSE:")
+            add(_clip(response, 2000))
+    
+    return "\n".join(lines) + "\n"
 
 
 def view_calls(debate_id, agent_filter=None, model_filter=None, show_summary=True):
@@ -150,51 +273,53 @@ def view_calls(debate_id, agent_filter=None, model_filter=None, show_summary=Tru
         model_filter: Optional model name to filter by
         show_summary: Whether to show summary statistics
     """
-    entries = load_calls(debate_id)
+    with buffered_stdout():
+        _view_calls(debate_id, agent_filter, model_filter, show_summary)
+
+
+def _view_calls(debate_id, agent_filter, model_filter, show_summary):
+    """Print the filtered calls and summary (stdout is buffered by view_calls)."""
+    
+    calls = iter_calls(debate_id, agent_filter, model_filter)
     
-    if not entries:
+    first = next(calls, None)
+    if first is None and next(load_calls(debate_id), None) is None:
         print(f"No raw model calls found for debate: {debate_id}")
         print(f"Expected file: debates/{debate_id}/raw_model_calls.jsonl")
         return
+    if first is not None:
+        calls = chain((first,), calls)
     
-    # Apply filters
-    if agent_filter:
-        entries = [e for e in entries if agent_filter.lower() in e['agent_name'].lower()]
-    if model_filter:
-        entries = [e for e in entries if model_filter.lower() in e['model'].lower()]
-    
-    # Show summary
     if show_summary:
-        print(f"\n{'='*100}")
+        print("\n" + _RULE)
         print(f"RAW MODEL CALLS - Debate {debate_id}")
-        print(f"{'='*100}")
-        print(f"Total calls: {len(entries)}")
+        print(_RULE)
+    
+    # Show entries, counting them for the summary in the same pass
+    total = 0
+    agents = Counter()
+    models = Counter()
+    for i, entry in enumerate(calls):
+        total += 1
+        agents[entry['agent_name']] += 1
+        models[entry['model']] += 1
         
-        # Group by agent
-        agents = {}
-        for entry in entries:
-            agent = entry['agent_name']
-            agents[agent] = agents.get(agent, 0) + 1
+        print_call(entry, i, show_full=True)
+    
+    # Show summary
+    if show_summary:
+        print("\n" + _RULE)
+        print(f"Total calls: {total}")
         
         print("\nCalls by agent:")
-        for agent, count in sorted(agents.items()):
+        for agent, count in agents.most_common():
             print(f"  - {agent}: {count}")
         
-        # Group by model
-        models = {}
-        for entry in entries:
-            model = entry['model']
-            models[model] = models.get(model, 0) + 1
-        
         print("\nCalls by model:")
-        for model, count in sorted(models.items()):
+        for model, count in models.most_common():
             print(f"  - {model}: {count}")
     
-    # Show entries
-    for i, entry in enumerate(entries):
-        print_call(entry, i, show_full=True)
-    
-    print(f"\n{'='*100}\n")
+    print("\n" + _RULE + "\n")
 
 
 def main():